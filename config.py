@@ -31,6 +31,7 @@ class DownloadConfig:
     socket_timeout: int = 30
     fragment_retries: int = 10
     rate_limit: Optional[str] = None
+    batch_starts_per_minute: int = 30
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -160,6 +161,9 @@ class AppConfig:
         if self.download.max_concurrent_downloads < 1:
             errors.append("Max concurrent downloads must be >= 1")
 
+        if self.performance.thread_pool_size < 1:
+            errors.append("Thread pool size must be >= 1")
+
         if self.security.max_file_size < 1024 * 1024:
             errors.append("Max file size must be >= 1MB")
 
@@ -117,3 +117,33 @@ class DownloadQueue:
         with self._condition:
             self._active.discard(url)
             self._condition.notify()
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often an action may start."""
+
+    def __init__(self, rate_per_minute: float = 30, burst: Optional[int] = None):
+        self.rate = rate_per_minute / 60.0  # Tokens per second; <= 0 disables limiting
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_minute)))
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
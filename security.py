@@ -1,6 +1,7 @@
 """
 security.py - Security Layer
 """
+import functools
 import hashlib
 import hmac
 import secrets
@@ -8,6 +9,24 @@ from urllib.parse import urlparse
 from typing import List, Optional
 import re
 
+# Loopback / RFC 1918 / unique-local prefixes, compiled once as one alternation
+_PRIVATE_HOST_RE = re.compile(
+    r'^(?:127\.|10\.|172\.(?:1[6-9]|2[0-9]|3[0-1])\.|192\.168\.|localhost$|::1$|fc00:)'
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _scheme_and_host(url: str) -> tuple[str, str]:
+    """(scheme, netloc) of url; batches repeat the same hosts, so results are cached"""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
+
+
+@functools.lru_cache(maxsize=512)
+def _is_private_host(hostname: str) -> bool:
+    """Check if hostname is a private IP or localhost."""
+    return _PRIVATE_HOST_RE.match(hostname) is not None
+
 class SecurityValidator:
     """Security validation and sanitization."""
 
@@ -21,22 +40,22 @@ class SecurityValidator:
     def validate_url(self, url: str) -> tuple[bool, Optional[str]]:
         """Validate URL for security."""
         try:
-            parsed = urlparse(url)
+            scheme, netloc = _scheme_and_host(url)
 
             # Check protocol
-            if parsed.scheme not in self.allowed_protocols:
-                return False, f"Protocol {parsed.scheme} not allowed"
+            if scheme not in self.allowed_protocols:
+                return False, f"Protocol {scheme} not allowed"
 
             # Check domain blocklist
-            if parsed.netloc in self.blocked_domains:
+            if netloc in self.blocked_domains:
                 return False, "Domain is blocked"
 
             # Check domain allowlist (if configured)
-            if self.allowed_domains and parsed.netloc not in self.allowed_domains:
+            if self.allowed_domains and netloc not in self.allowed_domains:
                 return False, "Domain not in allowlist"
 
             # Check for local/private IPs
-            if self._is_private_ip(parsed.netloc):
+            if self._is_private_ip(netloc):
                 return False, "Private IP addresses not allowed"
 
             return True, None
@@ -46,16 +65,7 @@ class SecurityValidator:
 
     def _is_private_ip(self, hostname: str) -> bool:
         """Check if hostname is a private IP."""
-        private_patterns = [
-            r'^127\.',
-            r'^10\.',
-            r'^172\.(1[6-9]|2[0-9]|3[0-1])\.',
-            r'^192\.168\.',
-            r'^localhost$',
-            r'^::1$',
-            r'^fc00:',
-        ]
-        return any(re.match(pattern, hostname) for pattern in private_patterns)
+        return _is_private_host(hostname)
 
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to prevent path traversal."""
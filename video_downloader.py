@@ -1,19 +1,22 @@
 import os
 import sys
-import subprocess
 import threading
 from pathlib import Path
 import customtkinter as ctk
 import tkinter as tk
-from tkinter import filedialog, messagebox
-import yt_dlp
+from tkinter import filedialog, messagebox, ttk
 from datetime import datetime, timedelta
 import json
-import platform
-import pyperclip
 import time
 import sqlite3
 import re
+import queue
+import copy
+import weakref
+import functools
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ENTERPRISE-GRADE UPGRADE IMPORTS
@@ -24,18 +27,28 @@ from error_handling import (
     ErrorHandler, retry_on_error, CircuitBreaker,
     NetworkError, RateLimitError, ValidationError, FileSystemError
 )
-from performance import DownloadQueue, memoize, MemoryCache
+from performance import DownloadQueue, memoize, MemoryCache, RateLimiter
 from security import SecurityValidator
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UPDATE LOGIC MOVED TO MAIN ENTRY POINT (see bottom of file)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# === Browser capture imports ===
-try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-except Exception:
-    sync_playwright = None  # Will lazy-install if missing
+# === Lazily imported heavy modules ===
+# Both pull in hundreds of submodules; importing them on first use lets the
+# window paint first. BrowserCaptureEngine._ensure_playwright fills in
+# sync_playwright, _load_yt_dlp() fills in yt_dlp.
+sync_playwright = None
+yt_dlp = None
+
+
+def _load_yt_dlp():
+    """Import yt_dlp on first use and return the module"""
+    global yt_dlp
+    if yt_dlp is None:
+        import yt_dlp as _yt_dlp
+        yt_dlp = _yt_dlp
+    return yt_dlp
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GREENLET THREADING COMPATIBILITY FIX
@@ -52,6 +65,114 @@ logging.getLogger('asyncio').setLevel(logging.ERROR)
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Bytes -> MiB multiplier used by every size/speed log line
+_ONE_MB = 1.0 / (1024 * 1024)
+
+# In-progress card label templates (formatted on every card refresh)
+_PERCENT_FMT = "{:.1f}%"
+_SPEED_FMT = "⚡ {:.2f} MB/s"
+_ETA_FMT = "⏱️ {:02d}:{:02d}"
+_ETA_UNKNOWN = "⏱️ --:--"
+
+
+# (threshold, unit) tables for human-readable sizes and durations, largest first
+_SIZE_UNITS = ((1024 ** 3, "GB"), (1024 ** 2, "MB"), (1024, "KB"))
+_DURATION_UNITS = ((3600, "h", 60, "m"), (60, "m", 1, "s"))
+
+
+def _format_size(num_bytes, digits=1):
+    """Bytes as B/KB/MB/GB, picking the largest unit that fits"""
+    for threshold, unit in _SIZE_UNITS:
+        if num_bytes >= threshold:
+            return f"{num_bytes / threshold:.{digits}f} {unit}"
+    return f"{int(num_bytes or 0)} B"
+
+
+def _format_duration(seconds):
+    """Seconds as 1h 5m / 3m 20s / 42s"""
+    seconds = int(seconds or 0)
+    for threshold, unit, sub, sub_unit in _DURATION_UNITS:
+        if seconds >= threshold:
+            major, rest = divmod(seconds, threshold)
+            return f"{major}{unit} {rest // sub}{sub_unit}"
+    return f"{seconds}s"
+
+
+def _timestamp():
+    """Wall-clock HH:MM:SS for log prefixes (C-level strftime, no datetime object)"""
+    return time.strftime("%H:%M:%S")
+
+
+def format_progress(percent, speed, eta):
+    """(percent, speed, eta) label texts for an in-progress card"""
+    percent_text = _PERCENT_FMT.format(percent or 0)
+    speed_text = _SPEED_FMT.format(speed * _ONE_MB if speed and speed > 0 else 0)
+    if eta and eta > 0:
+        minutes, seconds = divmod(int(eta), 60)
+        eta_text = _ETA_FMT.format(minutes, seconds)
+    else:
+        eta_text = _ETA_UNKNOWN
+    return percent_text, speed_text, eta_text
+
+
+@functools.lru_cache(maxsize=1)
+def _path_opener():
+    """Callable that opens a file/folder with the OS default handler (resolved once)"""
+    if sys.platform == 'win32':
+        return os.startfile
+    import subprocess
+    command = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    # Popen, not run(): the Tk thread must not wait for the file manager to start
+    return lambda path: subprocess.Popen(
+        [command, path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+# A batch line is accepted only if the whole (stripped) line is an http(s) URL;
+# multiline so one findall() pulls every URL out of the textbox in a single scan
+_URL_LINE_RE = re.compile(r'^[^\S\n]*(https?://\S+)[^\S\n]*$', re.M)
+
+# Fallback output folder, resolved once at import
+_DEFAULT_DOWNLOAD_PATH = str(Path.home() / "Downloads")
+
+# Filename sanitizer table: control characters are dropped, tab/newline and
+# characters Windows forbids become "_" (one translate() pass)
+_TITLE_TRANS = str.maketrans({
+    **{chr(c): None for c in range(32)},
+    **{ch: '_' for ch in '<>:"/\\|?*\t\n\r'},
+})
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3',
+    'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6',
+    'LPT7', 'LPT8', 'LPT9',
+})
+
+# Resolutions offered as quality buttons when a site reports them
+_COMMON_HEIGHTS = (2160, 1440, 1080, 720, 480, 360, 240, 144)
+_COMMON_HEIGHTS_SET = frozenset(_COMMON_HEIGHTS)
+
+
+def _format_heights(formats):
+    """Set of integer heights among the video formats yt-dlp reported (one pass)"""
+    return {h for f in formats if f and type(h := f.get('height')) is int and f.get('vcodec') != 'none'}
+
+
+@functools.lru_cache(maxsize=32)
+def _quality_choices(heights):
+    """(label, value) pairs for the quality row, given a tuple of heights"""
+    return (("Best", "best"),) + tuple((f"{h}p", f"{h}p") for h in heights) + (("Audio", "audio"),)
+
+
+def _is_unsupported_error(exc):
+    """True if exc (or the error yt-dlp wrapped in it) is an UnsupportedError"""
+    unsupported = _load_yt_dlp().utils.UnsupportedError
+    if isinstance(exc, unsupported):
+        return True
+    exc_info = getattr(exc, 'exc_info', None)
+    return bool(exc_info) and isinstance(exc_info[1], unsupported)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODERN THEME CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -75,6 +196,12 @@ class Theme:
     ERROR = "#ef4444"             # Red  
     WARNING = "#f59e0b"           # Orange
     INFO = "#3b82f6"              # Blue
+
+    # Button hover shades (one step darker than the base color)
+    SUCCESS_HOVER = "#059669"
+    ERROR_HOVER = "#dc2626"
+    INFO_HOVER = "#2563eb"
+    ACCENT_SECONDARY_HOVER = "#5568d3"
     
     # Text colors
     TEXT_PRIMARY = "#ffffff"
@@ -92,6 +219,9 @@ class Theme:
     FONT_BODY = ("Segoe UI", 12)
     FONT_SMALL = ("Segoe UI", 10)
     FONT_BUTTON = ("Segoe UI", 13, "bold")
+    FONT_STAT_VALUE = ("Segoe UI", 20, "bold")
+    FONT_ICON = ("Segoe UI", 24)
+    FONT_RADIO = FONT_BODY  # Shared CTkFont once init_fonts() has run
     
     # Spacing
     PADDING_XLARGE = 30
@@ -110,6 +240,27 @@ class Theme:
     INPUT_HEIGHT = 45
     HEADER_HEIGHT = 80
 
+    @classmethod
+    def init_fonts(cls):
+        """Create shared CTkFont objects (needs a Tk root to exist)"""
+        family, size = cls.FONT_BODY
+        cls.FONT_RADIO = ctk.CTkFont(family=family, size=size)
+
+
+# Shared stat card styling, resolved once instead of per create_stat_card call
+_STAT_CARD_FRAME_KWARGS = dict(fg_color=Theme.BG_INPUT, corner_radius=Theme.RADIUS_SMALL)
+_STAT_TITLE_FONT = Theme.FONT_SMALL
+_STAT_VALUE_FONT = Theme.FONT_STAT_VALUE
+
+# Shared quality radio styling (Download and Batch tabs); the font is
+# Theme.FONT_RADIO, passed per widget because it is created after the root
+_RADIO_KWARGS = dict(
+    fg_color=Theme.ACCENT_PRIMARY,
+    hover_color=Theme.HOVER,
+    border_color=Theme.BORDER,
+    text_color=Theme.TEXT_PRIMARY
+)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BROWSER CAPTURE ENGINE - ENTERPRISE-GRADE (VIDEO-ONLY)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -179,10 +330,16 @@ class BrowserCaptureEngine:
         r'/poster',  # Posters
     ]
 
+    # Each pattern list folded into one case-insensitive alternation:
+    # a single scan per URL instead of a Python loop over re.search calls
+    _VIDEO_URL_RE = re.compile('|'.join(f'(?:{p})' for p in VIDEO_URL_PATTERNS), re.I)
+    _EXCLUDE_RE = re.compile('|'.join(f'(?:{p})' for p in EXCLUDE_PATTERNS), re.I)
+
     def __init__(self, log_fn, on_found):
         self.log = log_fn
         self.on_video_found = on_found
-        self._stop = False
+        # Set by stop() / browser disconnect; waits on it wake immediately
+        self._stop_event = threading.Event()
         self._stopping = False
         self._is_running = False
         self.browser = None
@@ -204,12 +361,9 @@ class BrowserCaptureEngine:
         if not url:
             return False
 
-        url_lower = url.lower()
-
         # FIRST: Check exclude patterns (must be strict)
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, url_lower):
-                return False
+        if self._EXCLUDE_RE.search(url):
+            return False
 
         # SECOND: Check content type (if available)
         if content_type:
@@ -219,10 +373,10 @@ class BrowserCaptureEngine:
                     return True
 
         # THIRD: Check URL patterns (be generous)
-        for pattern in self.VIDEO_URL_PATTERNS:
-            if re.search(pattern, url_lower):
-                self.log(f"✅ Video detected by URL pattern: {pattern}")
-                return True
+        match = self._VIDEO_URL_RE.search(url)
+        if match:
+            self.log(f"✅ Video detected by URL pattern: {match.group(0)}")
+            return True
 
         # FOURTH: Check for range requests (video streams often use these)
         if headers:
@@ -238,6 +392,7 @@ class BrowserCaptureEngine:
                 # FIXED: Lower threshold to 100KB instead of 1MB
                 if content_length > 100000:  # 100KB
                     # Also check if URL looks video-like
+                    url_lower = url.lower()
                     if any(hint in url_lower for hint in ['video', 'stream', 'media', 'mp4', 'webm', 'm3u8']):
                         self.log(f"✅ Video detected by size + URL hint: {content_length} bytes")
                         return True
@@ -456,17 +611,21 @@ class BrowserCaptureEngine:
                 except Exception:
                     pass
 
-            import threading as _th
             def blob_poller():
-                while not self._stop:
+                while not self._stop_event.is_set():
                     poll_blobs()
-                    _th.Event().wait(2)
+                    self._stop_event.wait(2)
 
-            _th.Thread(target=blob_poller, daemon=True).start()
+            threading.Thread(target=blob_poller, daemon=True).start()
 
         except Exception as e:
             self.log(f"⚠️ Blob monitoring setup failed: {e}")
 
+    @property
+    def is_running(self) -> bool:
+        """True while a capture session (browser window) is open"""
+        return self._is_running
+
     def _ensure_playwright(self) -> bool:
         """Ensure Playwright is available and configured."""
         global sync_playwright
@@ -500,7 +659,7 @@ class BrowserCaptureEngine:
             return False
 
         self._is_running = True
-        self._stop = False
+        self._stop_event.clear()
         self._stopping = False
         self.captured_videos.clear()
         self._video_elements.clear()
@@ -585,7 +744,7 @@ class BrowserCaptureEngine:
             def request_interceptor(route):
                 req_url = (route.request.url or '').lower()
                 try:
-                    if any(re.search(p, req_url) for p in self.VIDEO_URL_PATTERNS):
+                    if self._VIDEO_URL_RE.search(req_url):
                         self.log(f"🔍 Intercepted potential video request: {req_url[:80]}...")
                 except Exception:
                     pass
@@ -595,7 +754,7 @@ class BrowserCaptureEngine:
 
             # Enhanced response handler - ONLY videos
             def response_handler(response):
-                if self._stop:
+                if self._stop_event.is_set():
                     return
                 try:
                     url = response.url or ''
@@ -711,16 +870,16 @@ class BrowserCaptureEngine:
 
             import time as _t
             t0 = _t.time()
-            while not self._stop and (_t.time() - t0) < timeout_sec:
+            while not self._stop_event.is_set() and (_t.time() - t0) < timeout_sec:
                 try:
                     if self.browser and not self.browser.is_connected():
-                        self._stop = True
+                        self._stop_event.set()
                         break
                 except Exception:
                     pass
                 if (_t.time() - t0) % 5 < 0.2:
                     self._extract_video_sources()
-                _t.sleep(0.2)
+                self._stop_event.wait(0.2)  # Returns at once when stop() is called
 
             return True
 
@@ -735,7 +894,7 @@ class BrowserCaptureEngine:
     def stop(self):
         """Graceful shutdown of capture session."""
         self._stopping = True
-        self._stop = True
+        self._stop_event.set()
         self.log("🛑 Shutting down capture engine...")
         self._cleanup('user_stop')
 
@@ -787,6 +946,12 @@ class BrowserCaptureEngine:
 # DATABASE (NO CHANGES)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# One row of the downloads table, in column order
+HistoryRow = namedtuple('HistoryRow', [
+    'id', 'url', 'title', 'site', 'quality', 'file_path', 'file_size',
+    'duration', 'download_date', 'completion_time', 'average_speed', 'status'
+])
+
 class DatabaseManager:
     """Optimized database manager"""
     
@@ -804,6 +969,11 @@ class DatabaseManager:
         self.conn.execute("PRAGMA cache_size = -64000")
         
         self.cursor = self.conn.cursor()
+
+        # Guards self.cursor for writes and tracks begin()/commit() nesting
+        self._tx_lock = threading.RLock()
+        self._tx_depth = 0
+
         self.create_tables()
         self.create_indexes()
     
@@ -836,6 +1006,13 @@ class DatabaseManager:
                 added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS unsupported_hosts (
+                host TEXT PRIMARY KEY,
+                added_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
         
         self.conn.commit()
     
@@ -844,6 +1021,8 @@ class DatabaseManager:
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_downloads_date ON downloads(download_date DESC)",
             "CREATE INDEX IF NOT EXISTS idx_downloads_site ON downloads(site)",
+            # History/search: WHERE status = 'completed' ORDER BY download_date DESC
+            "CREATE INDEX IF NOT EXISTS idx_downloads_status_date ON downloads(status, download_date DESC)",
         ]
         for idx in indexes:
             try:
@@ -852,29 +1031,73 @@ class DatabaseManager:
                 pass
         self.conn.commit()
     
+    def begin(self):
+        """Open a write transaction; add_download() defers its commit until commit()"""
+        with self._tx_lock:
+            if self._tx_depth == 0 and not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self._tx_depth += 1
+
+    def commit(self):
+        """Close the transaction opened by begin() (one fsync for the whole batch)"""
+        with self._tx_lock:
+            self._tx_depth = max(0, self._tx_depth - 1)
+            if self._tx_depth == 0:
+                self.conn.commit()
+
     def add_download(self, url, title, site, quality, file_path, file_size=0, duration=0, completion_time=0, avg_speed=0):
         """Add download with debug output"""
         try:
             # Debug output
-            print(f"[DB SAVE] Title: {title[:30]} | Size: {file_size/(1024**2):.1f}MB | Duration: {duration}s | Speed: {avg_speed/(1024**2):.1f}MB/s")
+            print(f"[DB SAVE] Title: {title[:30]} | Size: {file_size * _ONE_MB:.1f}MB | Duration: {duration}s | Speed: {avg_speed * _ONE_MB:.1f}MB/s")
             
-            self.cursor.execute('''
-                INSERT INTO downloads (url, title, site, quality, file_path, file_size, duration, completion_time, average_speed, status)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (url, title, site, quality, file_path, file_size, duration, completion_time, avg_speed, 'completed'))
-            self.conn.commit()
+            with self._tx_lock:
+                self.cursor.execute('''
+                    INSERT INTO downloads (url, title, site, quality, file_path, file_size, duration, completion_time, average_speed, status)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (url, title, site, quality, file_path, file_size, duration, completion_time, avg_speed, 'completed'))
+                if self._tx_depth == 0:
+                    self.conn.commit()
+                row_id = self.cursor.lastrowid
             
-            print(f"[DB SAVE] ✅ Successfully saved to database (ID: {self.cursor.lastrowid})")
-            return self.cursor.lastrowid
+            print(f"[DB SAVE] ✅ Successfully saved to database (ID: {row_id})")
+            return row_id
         except Exception as e:
             print(f"[DB ERROR] ❌ {e}")
             return None
 
-    
-    def get_download_history(self, limit=100):
-        """Get history"""
-        self.cursor.execute('SELECT * FROM downloads WHERE status = "completed" ORDER BY download_date DESC LIMIT ?', (limit,))
-        return self.cursor.fetchall()
+
+    def add_downloads_bulk(self, rows):
+        """Insert many completed downloads (dicts keyed like add_download's args) in one transaction"""
+        if not rows:
+            return 0
+        try:
+            with self._tx_lock:
+                # One fixed statement text, so sqlite3 prepares it once and
+                # reuses it from its statement cache on every flush
+                self.cursor.executemany('''
+                    INSERT INTO downloads (url, title, site, quality, file_path, file_size, duration, completion_time, average_speed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (r['url'], r['title'], r['site'], r['quality'], r['file_path'],
+                     r.get('file_size', 0), r.get('duration', 0),
+                     r.get('completion_time', 0), r.get('avg_speed', 0))
+                    for r in rows
+                ])
+                if self._tx_depth == 0:
+                    self.conn.commit()
+            print(f"[DB SAVE] ✅ Saved {len(rows)} downloads in bulk")
+            return len(rows)
+        except Exception as e:
+            print(f"[DB ERROR] ❌ {e}")
+            return 0
+
+    def get_download_history(self, limit=100, offset=0):
+        """Get history (one LIMIT/OFFSET page)"""
+        # Private cursor: history/stats are also read from worker threads
+        cur = self.conn.cursor()
+        cur.execute('SELECT * FROM downloads WHERE status = "completed" ORDER BY download_date DESC LIMIT ? OFFSET ?', (limit, offset))
+        return list(map(HistoryRow._make, cur.fetchall()))
     
     def search_downloads(self, query):
         """Search"""
@@ -888,41 +1111,43 @@ class DatabaseManager:
     
     def get_statistics(self):
         """Get statistics with PROPER calculations"""
+        cur = self.conn.cursor()
         # Total stats
-        self.cursor.execute('''
+        cur.execute('''
             SELECT 
                 COUNT(*) as total,
                 COALESCE(SUM(file_size), 0) as size,
                 COALESCE(SUM(duration), 0) as duration,
                 COALESCE(SUM(average_speed), 0) as total_speed,
-                COUNT(CASE WHEN average_speed > 0 THEN 1 END) as speed_count
+                COUNT(CASE WHEN average_speed > 0 THEN 1 END) as speed_count,
+                AVG(CASE WHEN completion_time > 0 THEN completion_time END) as avg_completion
             FROM downloads WHERE status = 'completed'
         ''')
-        total = self.cursor.fetchone()
+        total = cur.fetchone()
         
         # Today
         today = datetime.now().date().isoformat()
-        self.cursor.execute('''
+        cur.execute('''
             SELECT COUNT(*), COALESCE(SUM(file_size), 0)
             FROM downloads WHERE DATE(download_date) = ? AND status = 'completed'
         ''', (today,))
-        today_stats = self.cursor.fetchone()
+        today_stats = cur.fetchone()
         
         # Week
         week_ago = (datetime.now() - timedelta(days=7)).date().isoformat()
-        self.cursor.execute('''
+        cur.execute('''
             SELECT COUNT(*), COALESCE(SUM(file_size), 0)
             FROM downloads WHERE DATE(download_date) >= ? AND status = 'completed'
         ''', (week_ago,))
-        week_stats = self.cursor.fetchone()
+        week_stats = cur.fetchone()
         
         # Sites
-        self.cursor.execute('''
+        cur.execute('''
             SELECT site, COUNT(*) as count
             FROM downloads WHERE status = 'completed' AND site IS NOT NULL
             GROUP BY site ORDER BY count DESC LIMIT 10
         ''')
-        sites = self.cursor.fetchall()
+        sites = cur.fetchall()
         
         # Calculate average speed
         avg_speed = (total[3] / total[4]) if total[4] > 0 else 0
@@ -932,6 +1157,7 @@ class DatabaseManager:
             'total_size': total[1] or 0,
             'total_duration': total[2] or 0,
             'average_speed': avg_speed,
+            'average_completion_time': total[5] or 0,
             'today_downloads': today_stats[0] or 0,
             'today_size': today_stats[1] or 0,
             'week_downloads': week_stats[0] or 0,
@@ -953,21 +1179,57 @@ class DatabaseManager:
         self.cursor.execute('SELECT * FROM queue WHERE status = "pending" ORDER BY priority DESC, added_date ASC')
         return self.cursor.fetchall()
     
+    # Unsupported-host notes expire, so pages fixed by newer yt-dlp get retried
+    UNSUPPORTED_HOST_TTL_DAYS = 7
+
+    def get_unsupported_hosts(self):
+        """Hosts yt-dlp rejected as unsupported within the last UNSUPPORTED_HOST_TTL_DAYS"""
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT host FROM unsupported_hosts WHERE added_date >= datetime('now', ?)",
+            (f'-{self.UNSUPPORTED_HOST_TTL_DAYS} days',)
+        )
+        return {row[0] for row in cur.fetchall()}
+
+    def add_unsupported_host(self, host):
+        """Remember (or re-date) a host yt-dlp had no extractor for"""
+        try:
+            with self._tx_lock:
+                self.cursor.execute('INSERT OR REPLACE INTO unsupported_hosts (host) VALUES (?)', (host,))
+                if self._tx_depth == 0:
+                    self.conn.commit()
+        except Exception as e:
+            print(f"[DB ERROR] ❌ {e}")
+
+    def remove_unsupported_host(self, host):
+        """Forget a host once yt-dlp has analyzed a page on it"""
+        try:
+            with self._tx_lock:
+                self.cursor.execute('DELETE FROM unsupported_hosts WHERE host = ?', (host,))
+                if self._tx_depth == 0:
+                    self.conn.commit()
+        except Exception as e:
+            print(f"[DB ERROR] ❌ {e}")
+
     def clear_history(self):
         """Clear history"""
         self.cursor.execute('DELETE FROM downloads')
+        self.cursor.execute('DELETE FROM unsupported_hosts')
         self.conn.commit()
     
     def get_database_size(self):
         """Get DB size"""
         try:
-            return os.path.getsize(self.db_path) / (1024 * 1024)
+            return os.path.getsize(self.db_path) * _ONE_MB
         except:
             return 0
     
     def close(self):
-        """Close"""
+        """Close (flushing any batch transaction still open)"""
         try:
+            with self._tx_lock:
+                self._tx_depth = 0
+                self.conn.commit()
             self.conn.close()
         except:
             pass
@@ -994,8 +1256,8 @@ class DownloadItem:
         self.file_path = ""
         self.start_time = None
         self.end_time = None
-        self.thread = None
         self.thumbnail = None
+        self.dirty = True  # Progress changed since its card was last refreshed
 
     def update_progress(self, data: dict):
         """Update download progress from normalized callback data"""
@@ -1024,6 +1286,8 @@ class DownloadItem:
         if "eta" in data and data["eta"] is not None:
             self.eta = int(data["eta"])
 
+        self.dirty = True
+
 class ActiveDownloadsManager:
     """Manages multiple simultaneous downloads"""
     def __init__(self):
@@ -1061,11 +1325,13 @@ class ActiveDownloadsManager:
         """Remove download from manager"""
         with self.lock:
             if download_id in self.downloads:
-                # Cancel thread if still running
+                # Cancel the download if it has not finished yet
                 item = self.downloads[download_id]
-                if item.thread and item.thread.is_alive():
-                    # Set cancellation flag
+                if item.status in ("queued", "downloading", "processing"):
                     item.status = "cancelled"
+                    manager = getattr(item, "download_manager_instance", None)
+                    if manager:
+                        manager.cancel()
                 del self.downloads[download_id]
 
     def update_status(self, download_id, status, error_message="", file_path=""):
@@ -1118,6 +1384,10 @@ class _YDLLogger:
 
 class DownloadManager:
     """Enhanced download manager with enterprise features"""
+
+    # yt-dlp can fire 100+ hooks/s: forward one only after this much progress or time
+    PROGRESS_MIN_STEP = 0.5  # percent
+    PROGRESS_MIN_INTERVAL = 0.1  # seconds
     
     def __init__(self, progress_callback=None, log_callback=None, config=None, logger=None, security=None, error_handler=None):
         self.progress_callback = progress_callback
@@ -1128,6 +1398,7 @@ class DownloadManager:
         self.error_handler = error_handler
         self.is_cancelled = False
         self.start_time = None
+        self._last_hook = (-100.0, 0.0)  # (percent, monotonic time) last forwarded
     
     def log(self, msg):
         if self.log_callback:
@@ -1242,6 +1513,14 @@ class DownloadManager:
                     except (ValueError, AttributeError, TypeError):
                         percent = 0.0
 
+                # Throttle: drop ticks that move less than PROGRESS_MIN_STEP
+                # within PROGRESS_MIN_INTERVAL of the last forwarded one
+                now = time.monotonic()
+                last_pct, last_time = self._last_hook
+                if abs(percent - last_pct) < self.PROGRESS_MIN_STEP and now - last_time < self.PROGRESS_MIN_INTERVAL:
+                    return
+                self._last_hook = (percent, now)
+
                 # DEBUG: Log when progress_hook is called
                 if int(percent) % 10 == 0 and percent > 0:
                     print(f"[PROGRESS_HOOK] Raw: percent={percent:.1f}% speed={speed} eta={eta} | Has callback: {self.progress_callback is not None}")
@@ -1269,10 +1548,12 @@ class DownloadManager:
                     "eta": 0,
                 })
     
-    def download(self, url, quality="best", output_path=None, preferred_title=None, referer=None):
-        """Download video. Handles both yt-dlp URLs and captured stream URLs (blob:// or direct streams)."""
+    def download(self, url, quality="best", output_path=None, preferred_title=None, referer=None, info=None):
+        """Download video. Handles both yt-dlp URLs and captured stream URLs (blob:// or direct streams).
+        Pass a previously extracted `info` dict to skip the metadata fetch."""
         self.is_cancelled = False
         self.start_time = time.time()
+        self._last_hook = (-100.0, 0.0)
         
         # ═══════════════════════════════════════════════════════════════════════
         # ENTERPRISE: URL VALIDATION & SECURITY CHECK
@@ -1290,7 +1571,7 @@ class DownloadManager:
             self.logger.download_started(url, quality=quality)
         
         if not output_path:
-            output_path = str(Path.home() / "Downloads")
+            output_path = _DEFAULT_DOWNLOAD_PATH
         is_audio = (quality == "audio")
         
         # DETECT CAPTURED STREAM URLs (from browser capture)
@@ -1341,7 +1622,7 @@ class DownloadManager:
             size_bytes = os.path.getsize(downloaded_file)
             elapsed = max(1, int(time.time() - self.start_time))
             avg_speed = size_bytes / elapsed if size_bytes else 0
-            self.log(f"✅ Download complete! File: {os.path.basename(downloaded_file)} ({size_bytes/1024/1024:.1f} MB)")
+            self.log(f"✅ Download complete! File: {os.path.basename(downloaded_file)} ({size_bytes * _ONE_MB:.1f} MB)")
             return {
                 "success": True,
                 "info": {"title": chosen_title},
@@ -1353,27 +1634,32 @@ class DownloadManager:
             }
         ydl_opts = self._build_ydl_opts(url, quality, output_path, is_audio=is_audio,
                                         preferred_title=preferred_title, referer=referer)
+        prefetched_info = info
         info = {}
         try:
             # Cancellation before metadata extraction
             if self.is_cancelled:
                 return {"success": False, "error": "Download cancelled"}
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            with _load_yt_dlp().YoutubeDL(ydl_opts) as ydl:
+                if prefetched_info:
+                    # Reuse metadata from Analyze; yt-dlp mutates the dict, so work on a copy
+                    info = copy.deepcopy(prefetched_info)
+                else:
+                    info = ydl.extract_info(url, download=False)
                 title = info.get("title", "Unknown")
                 duration = info.get("duration", 0)
                 est_size = info.get("filesize") or info.get("filesize_approx") or 0
                 self.log(f"📝 {title[:60]}...")
                 if duration:
-                    m, s = divmod(int(duration), 60)
-                    self.log(f"⏱️ Duration: {m}m {s}s")
+                    self.log(f"⏱️ Duration: {_format_duration(duration)}")
                 if est_size:
-                    self.log(f"📦 Estimated Size: {est_size/1024/1024:.1f} MB")
+                    self.log(f"📦 Estimated Size: {est_size * _ONE_MB:.1f} MB")
                 # Cancellation before actual download
                 if self.is_cancelled:
                     return {"success": False, "error": "Download cancelled"}
                 self.log("⬇️ Starting download...")
-                result = ydl.extract_info(url, download=True)
+                # Download from the already-extracted info instead of re-fetching the page
+                result = ydl.process_ie_result(info, download=True)
             # Post-download cancellation guard
             if self.is_cancelled:
                 self.log("🛑 Download cancelled after completion - cleaning up")
@@ -1424,7 +1710,7 @@ class DownloadManager:
         # Stats
         size_bytes = os.path.getsize(downloaded_file) if downloaded_file and os.path.exists(downloaded_file) else 0
         if size_bytes:
-            self.log(f"✅ Download complete! File: {os.path.basename(downloaded_file)} ({size_bytes/1024/1024:.1f} MB)")
+            self.log(f"✅ Download complete! File: {os.path.basename(downloaded_file)} ({size_bytes * _ONE_MB:.1f} MB)")
         else:
             self.log("⚠️ File not found after download")
         elapsed = max(1, int(time.time() - self.start_time))
@@ -1459,7 +1745,7 @@ class DownloadManager:
         self.is_cancelled = False
         self.start_time = time.time()
         if not output_path:
-            output_path = str(Path.home() / "Downloads")
+            output_path = _DEFAULT_DOWNLOAD_PATH
 
         is_audio = (quality == "audio")
 
@@ -1484,7 +1770,7 @@ class DownloadManager:
             print(f"[BATCH] Note: URL has unusual suffix; forcing .mp4 output")
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with _load_yt_dlp().YoutubeDL(ydl_opts) as ydl:
                 result = ydl.extract_info(url, download=True)
 
             title = None
@@ -1514,7 +1800,7 @@ class DownloadManager:
 
             if downloaded_file and os.path.exists(downloaded_file):
                 actual_filesize = os.path.getsize(downloaded_file)
-                print(f"[BATCH] Found: {title} {actual_filesize/1024/1024:.1f} MB")
+                print(f"[BATCH] Found: {title} {actual_filesize * _ONE_MB:.1f} MB")
                 # Cleanup any unusual leftovers (e.g., .php with same base)
                 try:
                     self._cleanup_unusual_leftovers(downloaded_file)
@@ -1599,7 +1885,7 @@ class DownloadManager:
             # Get content length
             total_size = int(response.headers.get('content-length', 0))
             if total_size:
-                self.log(f"📦 Content size: {total_size/1024/1024:.1f} MB")
+                self.log(f"📦 Content size: {total_size * _ONE_MB:.1f} MB")
             
             # Detect extension from content-type or URL
             content_type = response.headers.get('content-type', '').lower()
@@ -1629,9 +1915,10 @@ class DownloadManager:
             
             # Download with progress
             downloaded = 0
+            last_logged_pct = -1  # Log a line only when the whole percent changes
             start_time = time.time()
             with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=1024 * 1024):  # 1MB chunks
                     if self.is_cancelled:
                         os.remove(filepath)
                         return None
@@ -1655,7 +1942,9 @@ class DownloadManager:
                                     'eta': eta
                                 })
                             
-                            self.log(f"⬇️ {pct:.0f}% ({downloaded/1024/1024:.1f}MB / {total_size/1024/1024:.1f}MB) | Speed: {speed/1024/1024:.1f}MB/s")
+                            if int(pct) != last_logged_pct:
+                                last_logged_pct = int(pct)
+                                self.log(f"⬇️ {pct:.0f}% ({downloaded * _ONE_MB:.1f}MB / {total_size * _ONE_MB:.1f}MB) | Speed: {speed * _ONE_MB:.1f}MB/s")
             
             elapsed = time.time() - start_time
             file_size = os.path.getsize(filepath)
@@ -1671,7 +1960,7 @@ class DownloadManager:
                     'eta': 0
                 })
             
-            self.log(f"✅ Binary download complete: {os.path.basename(filepath)} ({file_size/1024/1024:.1f} MB in {elapsed:.0f}s)")
+            self.log(f"✅ Binary download complete: {os.path.basename(filepath)} ({file_size * _ONE_MB:.1f} MB in {elapsed:.0f}s)")
             
             return filepath
             
@@ -1705,15 +1994,16 @@ class DownloadManager:
                 downloaded = 0
                 start_time = time.time()
                 
-                with open(tmp, "wb") as f:
+                # Unbuffered fd: chunks are already 1MB, so skip the
+                # buffered writer's extra copy and sync exactly once at the end
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                try:
                     for chunk in r.iter_content(chunk_size=1024 * 1024):  # 1MB chunks
                         # Cancellation during HTTP transfer
                         if self.is_cancelled:
                             self.log("🛑 HTTP download cancelled")
-                            try:
-                                f.close()
-                            except Exception:
-                                pass
+                            os.close(fd)
+                            fd = -1
                             try:
                                 if os.path.exists(tmp):
                                     os.remove(tmp)
@@ -1721,7 +2011,9 @@ class DownloadManager:
                                 pass
                             return ""
                         if chunk:
-                            f.write(chunk)
+                            view = memoryview(chunk)
+                            while view:
+                                view = view[os.write(fd, view):]
                             downloaded += len(chunk)
                             
                             # Update progress bar with speed and ETA
@@ -1730,7 +2022,7 @@ class DownloadManager:
                                 elapsed_so_far = time.time() - start_time
                                 speed = downloaded / elapsed_so_far if elapsed_so_far > 0 else 0
                                 eta = (total_size - downloaded) / speed if speed > 0 else 0
-                                
+                            
                                 self.progress_callback({
                                     "status": "downloading",
                                     "percent": percent,
@@ -1744,16 +2036,17 @@ class DownloadManager:
                             if downloaded % (10 * 1024 * 1024) < (1024 * 1024):
                                 if total_size > 0:
                                     pct = (downloaded / total_size) * 100
-                                    self.log(f"📥 {pct:.0f}% - Downloaded {downloaded / (1024 * 1024):.1f} MB / {total_size / (1024 * 1024):.1f} MB")
+                                    self.log(f"📥 {pct:.0f}% - Downloaded {downloaded * _ONE_MB:.1f} MB / {total_size * _ONE_MB:.1f} MB")
                                 else:
-                                    self.log(f"📥 Downloaded {downloaded / (1024 * 1024):.1f} MB...")
-                
-                # Atomically move into place
-                if os.path.exists(dest_path):
-                    try:
-                        os.remove(dest_path)
-                    except Exception:
-                        pass
+                                    self.log(f"📥 Downloaded {downloaded * _ONE_MB:.1f} MB...")
+
+                    # One durability barrier before the rename instead of per chunk
+                    getattr(os, "fdatasync", os.fsync)(fd)
+                finally:
+                    if fd >= 0:
+                        os.close(fd)
+
+                # Atomically move into place (os.replace overwrites on all platforms)
                 os.replace(tmp, dest_path)
                 
                 # Final progress update
@@ -1769,7 +2062,7 @@ class DownloadManager:
                         "eta": 0
                     })
                 
-                self.log(f"✅ HTTP download complete: {final_size / (1024 * 1024):.1f} MB in {final_elapsed:.0f}s")
+                self.log(f"✅ HTTP download complete: {final_size * _ONE_MB:.1f} MB in {final_elapsed:.0f}s")
 
             return dest_path if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0 else ""
         except Exception as e:
@@ -1814,17 +2107,11 @@ class DownloadManager:
         if not name:
             return "video"
 
-        import re
-
         # Remove HTML entities
         name = name.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
 
-        # Remove control characters
-        name = ''.join(ch for ch in name if ord(ch) >= 32 or ch in '\t\n\r')
-
-        # Replace invalid characters
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-        name = re.sub(invalid_chars, '_', name)
+        # Drop control characters and replace invalid ones
+        name = name.translate(_TITLE_TRANS)
 
         # Collapse whitespace
         name = ' '.join(name.split())
@@ -1833,12 +2120,7 @@ class DownloadManager:
         name = name.strip(' .')
 
         # Check reserved names
-        reserved = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 
-                   'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                   'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 
-                   'LPT7', 'LPT8', 'LPT9'}
-
-        if name.upper() in reserved:
+        if name.upper() in _RESERVED_NAMES:
             name = f"_{name}"
 
         # Limit length
@@ -1916,8 +2198,10 @@ class DownloadManager:
                 return (False, "")
             base, _ = os.path.splitext(latest)
             out_mp4 = base + ".mp4"
+            import subprocess
             cmd = ["ffmpeg", "-y", "-i", latest, "-c", "copy", "-movflags", "+faststart", out_mp4]
-            p = subprocess.run(cmd, capture_output=True)
+            # Output is never read: discard it instead of buffering it in memory
+            p = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, timeout=300)
             if p.returncode == 0 and os.path.exists(out_mp4) and os.path.getsize(out_mp4) > 0:
                 return (True, out_mp4)
             return (False, "")
@@ -2008,9 +2292,58 @@ class DownloadManager:
 
 class UltimateDownloaderModern(ctk.CTk):
     """Ultra-modern video downloader interface"""
+
+    # Activity log ring buffer: once the textbox exceeds MAX_LOG_LINES the
+    # oldest LOG_TRIM_CHUNK lines are dropped in a single delete
+    MAX_LOG_LINES = 2000
+    LOG_TRIM_CHUNK = 1000
+    LOG_QUEUE_MAX = 10000  # Lines beyond this are dropped rather than blocking workers
+    LOG_FLUSH_MAX = 200  # Lines inserted per flush tick
+
+    # Seconds a get_statistics() result is reused by tab switches
+    STATS_CACHE_TTL = 5
+
+    # Completed cards built per Tk tick when the Downloaded tab is refreshed
+    COMPLETED_RENDER_CHUNK = 20
+
+    # Finished in-progress cards kept hidden for reuse by the next download
+    CARD_POOL_MAX = 10
+
+    # Browser capture sessions (each can hold a thread for up to 300s) run at once
+    MAX_CONCURRENT_CAPTURES = 2
+
+    # How long a non-modal toast stays on screen
+    TOAST_MS = 5000
+
+    # History list rows fetched per LIMIT/OFFSET page
+    HISTORY_PAGE_SIZE = 100
+    HISTORY_SCROLL_DEBOUNCE_MS = 150
+
+    # (label, value) pairs for the default Download and Batch quality rows
+    _QUALITY_ITEMS = (
+        ("🏆 Best", "best"),
+        ("📺 1080p", "1080p"),
+        ("🎬 720p", "720p"),
+        ("📱 480p", "480p"),
+        ("🎵 Audio", "audio"),
+    )
+    _BATCH_QUALITY_ITEMS = (
+        ("Best", "best"),
+        ("1080p", "1080p"),
+        ("720p", "720p"),
+        ("480p", "480p"),
+        ("Audio", "audio"),
+    )
+
+    # Completed batch rows buffered per bulk INSERT + commit
+    BATCH_FLUSH_ROWS = 20
+
+    # Best + up to 8 heights + Audio: the most radios the quality row shows
+    QUALITY_POOL_SIZE = 10
     
     def __init__(self):
         super().__init__()
+        Theme.init_fonts()
         
         # Window configuration
         self.title("🎬 Ultimate Video Downloader Pro")
@@ -2020,8 +2353,15 @@ class UltimateDownloaderModern(ctk.CTk):
         
         # State management
         self.is_downloading = False
-        self.download_path = str(Path.home() / "Downloads")
-        self._log_buffer = []  # Buffer for early log messages
+        self.download_path = _DEFAULT_DOWNLOAD_PATH
+        self._log_buffer = deque(maxlen=self.MAX_LOG_LINES)  # Buffer for early log messages
+        self.log_textbox = None  # Created by create_shared_log
+        self._log_queue = queue.Queue(maxsize=self.LOG_QUEUE_MAX)  # Pending lines, drained by _flush_log_queue
+        self._log_flush_pending = False
+        self._see_scheduled = False  # Auto-scroll coalesced into one after_idle
+        self._last_stats = (None, None, None)  # Last texts shown on the stat cards
+        self._stats_cache = (0.0, None)  # (monotonic time, get_statistics() result)
+        self._stats_gen = 0  # Bumped when data changes; stale workers don't cache
         
         # ═══════════════════════════════════════════════════════════════════════════
         # ENTERPRISE-GRADE INITIALIZATION
@@ -2047,6 +2387,9 @@ class UltimateDownloaderModern(ctk.CTk):
             str(Path.home() / ".ultimate_downloader_v9.db")
         )
         
+        # Hosts with no yt-dlp extractor: Analyze points straight at Capture
+        self._unsupported_hosts = self.db.get_unsupported_hosts()
+        
         # Setup downloads manager for queue-based system
         self.downloads_manager = ActiveDownloadsManager()
         
@@ -2068,18 +2411,50 @@ class UltimateDownloaderModern(ctk.CTk):
         )
         
         self.capture_engine = None
+        # Capture engines by page URL; entries vanish once an engine is dropped
+        self._capture_cache = weakref.WeakValueDictionary()
+
+        # Long-lived YoutubeDL instances keyed by options, so extractor and
+        # player-JS state survive across Analyze clicks. YoutubeDL is not
+        # thread-safe, so each thread keeps its own pool; the registry (and
+        # its short lock) only exists so shutdown can close them all
+        self._ydl_local = threading.local()
+        self._ydl_pools = []
+        self._ydl_pools_lock = threading.Lock()
+
+        # One background asyncio loop hosts Analyze / Capture / Batch work;
+        # blocking calls go to its shared default executor, sized from config
+        self._bg_loop = asyncio.new_event_loop()
+        self._bg_loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=self.config.performance.thread_pool_size,
+            thread_name_prefix="bg-worker"
+        ))
+        # Downloads (single and batch) get their own pool, so long transfers
+        # can never starve Analyze / stats / Downloaded-tab jobs; items beyond
+        # max_concurrent_downloads wait as "queued"
+        self._download_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.download.max_concurrent_downloads),
+            thread_name_prefix="download"
+        )
+        # Capture sessions are long-lived too; a small pool of their own keeps
+        # them off the shared executor, further captures wait for a slot
+        self._capture_executor = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_CAPTURES,
+            thread_name_prefix="capture"
+        )
+        threading.Thread(target=self._bg_loop.run_forever, daemon=True, name="bg-loop").start()
         
-        # ✅ FIRST: build the UI (this defines update_progress, creates widgets, etc.)
+        # ✅ FIRST: build the UI (creates widgets, etc.)
         self.setup_ui()
         
         # ✅ THEN: Per-download DownloadManager instances are created in start_download()
         # Do NOT create shared download_manager here - each download gets its own
         
-        # Log startup
+        # Log startup (stats are loaded when the History tab is first opened)
         self.logger.info("🚀 Application started", version=self.config.version, environment=self.config.environment)
-        
-        # Load stats
-        self.load_stats()
+
+        # Warm the yt_dlp import in the background so the first Analyze doesn't pay for it
+        self._submit_bg(self._run_blocking(_load_yt_dlp))
      
     def setup_ui(self):
         """Create the ultra-modern interface"""
@@ -2180,23 +2555,15 @@ class UltimateDownloaderModern(ctk.CTk):
         )
         content_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # ✅ CREATE SCROLLABLE FRAME
-        scrollable_frame = ctk.CTkScrollableFrame(
-            content_frame,
-            fg_color="transparent",
-            scrollbar_button_color=Theme.BG_TERTIARY,
-            scrollbar_button_hover_color=Theme.HOVER
-        )
-        scrollable_frame.pack(fill="both", expand=True)
-
-        # Tabs container
+        # Tabs container (flat layout: the window minsize fits tabs + log,
+        # so no outer scrollable frame is needed)
         tabs_container = ctk.CTkFrame(
-            scrollable_frame,
+            content_frame,
             fg_color="transparent"
         )
-        tabs_container.pack(fill="both", expand=False, pady=(0, 10))
+        tabs_container.pack(fill="both", expand=True, pady=(0, 10))
 
-        # NEW TABS STRUCTURE - 3 tabs only
+        # Tabs - Download, In Progress, Downloaded, Batch and History
         self.tabview = ctk.CTkTabview(
             tabs_container,
             fg_color=Theme.BG_SECONDARY,
@@ -2207,7 +2574,8 @@ class UltimateDownloaderModern(ctk.CTk):
             segmented_button_unselected_hover_color=Theme.BG_INPUT,
             corner_radius=Theme.RADIUS_LARGE,
             border_width=0,
-            height=500
+            height=500,
+            command=self._on_tab_changed
         )
         self.tabview.pack(fill="both", expand=True)
 
@@ -2215,18 +2583,73 @@ class UltimateDownloaderModern(ctk.CTk):
         self.tab_download = self.tabview.add("📥 Download")
         self.tab_in_progress = self.tabview.add("⏳ In Progress")
         self.tab_downloaded = self.tabview.add("✅ Downloaded")
+        self.tab_batch = self.tabview.add("📋 Batch")
+        self.tab_history = self.tabview.add("📊 History")
 
-        # Setup tabs
+        # Setup tabs - Batch and History are built on first visit
         self.setup_download_tab()
         self.setup_in_progress_tab()
         self.setup_downloaded_tab()
+        self._tabs_built = {"📥 Download", "⏳ In Progress", "✅ Downloaded"}
+        self._tabs_pending = set()
+
+        # Non-modal notifications (built on first use)
+        self._toast = None
+        self._toast_after_id = None
 
         # Activity log below tabs
-        self.create_shared_log(scrollable_frame)
+        self.create_shared_log(content_frame)
 
         # Start UI update loop for progress tracking
         self.update_download_displays()
 
+    def _on_tab_changed(self):
+        """Build the Batch/History tabs the first time they are opened"""
+        name = self.tabview.get()
+        if name in self._tabs_built:
+            if name == "📊 History":
+                self.load_stats()  # Revisit: served from the stats cache within its TTL
+            return
+        if name in self._tabs_pending:
+            return
+        self._tabs_pending.add(name)
+        # Build after the tab switch has repainted so the click feels instant
+        self.after_idle(self._build_lazy_tab, name)
+
+    def _build_lazy_tab(self, name):
+        """Populate a lazily built tab (runs from after_idle)"""
+        self._tabs_pending.discard(name)
+        self._tabs_built.add(name)
+        if name == "📋 Batch":
+            self.setup_batch_tab()
+        elif name == "📊 History":
+            self.setup_history_tab()
+            self.load_stats()
+
+    def _show_toast(self, text, color=Theme.SUCCESS):
+        """Show a self-dismissing banner at the bottom of the window (no modal event loop)"""
+        if self._toast is None:
+            self._toast = ctk.CTkLabel(
+                self,
+                text="",
+                font=Theme.FONT_BODY,
+                text_color=Theme.TEXT_PRIMARY,
+                corner_radius=Theme.RADIUS_SMALL,
+                padx=20,
+                pady=10
+            )
+        if self._toast_after_id is not None:
+            self.after_cancel(self._toast_after_id)
+        self._toast.configure(text=text, fg_color=color)
+        self._toast.place(relx=0.5, rely=1.0, y=-20, anchor="s")
+        self._toast.lift()
+        self._toast_after_id = self.after(self.TOAST_MS, self._hide_toast)
+
+    def _hide_toast(self):
+        """Remove the toast banner"""
+        self._toast_after_id = None
+        self._toast.place_forget()
+
     def create_shared_log(self, parent):
         """Create shared activity log visible on ALL tabs - SCROLLABLE VERSION"""
         
@@ -2263,28 +2686,18 @@ class UltimateDownloaderModern(ctk.CTk):
             command=self.clear_log
         ).pack(side="right")
         
-        # Log textbox (scrollable built-in)
-        self.log_textbox = ctk.CTkTextbox(
-            log_container,
-            fg_color=Theme.BG_INPUT,
-            border_width=0,
-            corner_radius=Theme.RADIUS_SMALL,
-            font=Theme.FONT_SMALL,
-            text_color=Theme.TEXT_SECONDARY,
-            wrap="word"
-        )
-        self.log_textbox.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        # Log textbox (native tk.Text - CTkTextbox degrades under sustained inserts)
+        self.log_textbox = self._create_log_text(log_container, pady=(0, 10))
+        # Bound once: the flush path calls these on every tick
+        self._log_insert = self.log_textbox.insert
+        self._log_see = self.log_textbox.see
         
         # Enable text widget
         self.log_textbox.configure(state="normal")
         
         # Flush buffer
-        if hasattr(self, '_log_buffer'):
-            for msg in self._log_buffer:
-                try:
-                    self.log_textbox.insert("end", msg + "\n")
-                except:
-                    pass
+        if self._log_buffer:
+            self.log_textbox.insert("end", "\n".join(self._log_buffer) + "\n")
             self._log_buffer.clear()
         
         # Initial message
@@ -2292,6 +2705,31 @@ class UltimateDownloaderModern(ctk.CTk):
         self.log_textbox.see("end")
 
 
+    def _create_log_text(self, log_container, pady):
+        """Build the Theme-styled native Text widget (plus ttk scrollbar) for the log"""
+        text_frame = tk.Frame(log_container, bg=Theme.BG_INPUT, bd=0, highlightthickness=0)
+        text_frame.pack(fill="both", expand=True, padx=20, pady=pady)
+
+        log_text = tk.Text(
+            text_frame,
+            bg=Theme.BG_INPUT,
+            fg=Theme.TEXT_SECONDARY,
+            insertbackground=Theme.TEXT_SECONDARY,
+            selectbackground=Theme.BG_TERTIARY,
+            bd=0,
+            highlightthickness=0,
+            padx=10,
+            pady=8,
+            wrap="word",
+            font=Theme.FONT_SMALL
+        )
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=log_text.yview)
+        log_text.configure(yscrollcommand=scrollbar.set)
+
+        scrollbar.pack(side="right", fill="y")
+        log_text.pack(side="left", fill="both", expand=True)
+        return log_text
+
     def setup_download_tab(self):
         """Create the main download interface"""
         
@@ -2366,27 +2804,13 @@ class UltimateDownloaderModern(ctk.CTk):
         
         self.quality_var = tk.StringVar(value="best")
         
-        qualities = [
-            ("🏆 Best", "best"),
-            ("📺 1080p", "1080p"),
-            ("🎬 720p", "720p"),
-            ("📱 480p", "480p"),
-            ("🎵 Audio", "audio")
-        ]
-        
-        for i, (label, value) in enumerate(qualities):
-            btn = ctk.CTkRadioButton(
-                self.quality_buttons_frame,
-                text=label,
-                variable=self.quality_var,
-                value=value,
-                font=Theme.FONT_BODY,
-                fg_color=Theme.ACCENT_PRIMARY,
-                hover_color=Theme.HOVER,
-                border_color=Theme.BORDER,
-                text_color=Theme.TEXT_PRIMARY
-            )
+        # Radios are recycled by create_dynamic_quality_buttons, never destroyed
+        self._quality_radio_pool = []
+        self._shown_quality_choices = self._QUALITY_ITEMS
+        for label, value in self._QUALITY_ITEMS:
+            btn = self._new_quality_radio(label, value)
             btn.pack(side="left", padx=10, pady=5)
+        self.after_idle(self._prewarm_quality_pool)
         
         # Output Path
         path_section = ctk.CTkFrame(card, fg_color="transparent")
@@ -2413,7 +2837,7 @@ class UltimateDownloaderModern(ctk.CTk):
             font=Theme.FONT_BODY,
             text_color=Theme.TEXT_PRIMARY
         )
-        self.path_entry.insert(0, str(Path.home() / "Downloads"))
+        self.path_entry.insert(0, _DEFAULT_DOWNLOAD_PATH)
         self.path_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         browse_btn = ctk.CTkButton(
@@ -2461,7 +2885,7 @@ class UltimateDownloaderModern(ctk.CTk):
             text="🔍 Analyze",
             height=45,
             fg_color=Theme.INFO,
-            hover_color="#2563eb",
+            hover_color=Theme.INFO_HOVER,
             border_width=0,
             corner_radius=Theme.RADIUS_SMALL,
             font=Theme.FONT_BODY,
@@ -2474,7 +2898,7 @@ class UltimateDownloaderModern(ctk.CTk):
             text="🌐 Browser Capture",
             height=45,
             fg_color=Theme.ACCENT_SECONDARY,
-            hover_color="#5568d3",
+            hover_color=Theme.ACCENT_SECONDARY_HOVER,
             border_width=0,
             corner_radius=Theme.RADIUS_SMALL,
             font=Theme.FONT_BODY,
@@ -2526,6 +2950,7 @@ class UltimateDownloaderModern(ctk.CTk):
             text_color=Theme.TEXT_MUTED
         )
         self.empty_progress_label.pack(expand=True, pady=50)
+        self._empty_progress_visible = True  # Mirrors the pack state; avoids re-packing every tick
 
     def setup_downloaded_tab(self):
         """Create the Downloaded tab showing completed downloads"""
@@ -2554,7 +2979,7 @@ class UltimateDownloaderModern(ctk.CTk):
             width=100,
             height=30,
             fg_color=Theme.ERROR,
-            hover_color="#dc2626",
+            hover_color=Theme.ERROR_HOVER,
             corner_radius=8,
             font=Theme.FONT_SMALL,
             command=self.clear_completed_downloads
@@ -2576,6 +3001,10 @@ class UltimateDownloaderModern(ctk.CTk):
             text_color=Theme.TEXT_MUTED
         )
         self.empty_downloaded_label.pack(expand=True, pady=50)
+        self._empty_downloaded_visible = True
+        self._completed_cards = {}  # (url, file_path) -> card, reused across refreshes
+        self._completed_order = []  # Keys in the order their cards are packed
+        self._completed_refresh_gen = 0  # Bumped per refresh; stale renders bail out
 
     def create_download_card(self, parent, download_item, is_active=True):
         """Create a card showing download progress or completed status"""
@@ -2590,6 +3019,7 @@ class UltimateDownloaderModern(ctk.CTk):
 
         # Store reference for updates
         card.download_id = download_item.id
+        card.is_active = is_active
 
         # Content frame
         content = ctk.CTkFrame(card, fg_color="transparent")
@@ -2604,7 +3034,7 @@ class UltimateDownloaderModern(ctk.CTk):
         icon_label = ctk.CTkLabel(
             top_row,
             text=icon_text,
-            font=("Segoe UI", 24),
+            font=Theme.FONT_ICON,
             width=40
         )
         icon_label.pack(side="left", padx=(0, 10))
@@ -2621,6 +3051,7 @@ class UltimateDownloaderModern(ctk.CTk):
             anchor="w"
         )
         title_label.pack(anchor="w")
+        card.title_label = title_label
 
         url_label = ctk.CTkLabel(
             text_frame,
@@ -2630,6 +3061,7 @@ class UltimateDownloaderModern(ctk.CTk):
             anchor="w"
         )
         url_label.pack(anchor="w")
+        card.url_label = url_label
 
         if is_active:
             # ACTIVE DOWNLOAD CARD
@@ -2649,10 +3081,14 @@ class UltimateDownloaderModern(ctk.CTk):
             stats_row = ctk.CTkFrame(content, fg_color="transparent")
             stats_row.pack(fill="x")
 
+            percent_text, speed_text, eta_text = format_progress(
+                download_item.progress, download_item.speed, download_item.eta
+            )
+
             # Progress percentage
             progress_label = ctk.CTkLabel(
                 stats_row,
-                text=f"{download_item.progress:.1f}%",
+                text=percent_text,
                 font=Theme.FONT_SMALL,
                 text_color=Theme.ACCENT_PRIMARY
             )
@@ -2660,10 +3096,9 @@ class UltimateDownloaderModern(ctk.CTk):
             card.progress_label = progress_label
 
             # Speed
-            speed_mb = download_item.speed / (1024 * 1024) if download_item.speed else 0
             speed_label = ctk.CTkLabel(
                 stats_row,
-                text=f"⚡ {speed_mb:.2f} MB/s",
+                text=speed_text,
                 font=Theme.FONT_SMALL,
                 text_color=Theme.TEXT_SECONDARY
             )
@@ -2671,11 +3106,6 @@ class UltimateDownloaderModern(ctk.CTk):
             card.speed_label = speed_label
 
             # ETA
-            if download_item.eta:
-                minutes, seconds = divmod(int(download_item.eta), 60)
-                eta_text = f"⏱️ {minutes:02d}:{seconds:02d}"
-            else:
-                eta_text = "⏱️ --:--"
             eta_label = ctk.CTkLabel(
                 stats_row,
                 text=eta_text,
@@ -2692,10 +3122,10 @@ class UltimateDownloaderModern(ctk.CTk):
                 width=80,
                 height=25,
                 fg_color=Theme.ERROR,
-                hover_color="#dc2626",
+                hover_color=Theme.ERROR_HOVER,
                 corner_radius=6,
                 font=Theme.FONT_SMALL,
-                command=lambda: self.cancel_specific_download(download_item.id)
+                command=lambda: self.cancel_specific_download(card.download_id)  # Follows card reuse
             )
             cancel_btn.pack(side="right")
 
@@ -2707,8 +3137,7 @@ class UltimateDownloaderModern(ctk.CTk):
 
             # File size
             if download_item.total_bytes:
-                size_mb = download_item.total_bytes / (1024 * 1024)
-                size_text = f"💾 {size_mb:.1f} MB"
+                size_text = f"💾 {_format_size(download_item.total_bytes)}"
             else:
                 size_text = "💾 Unknown size"
 
@@ -2762,7 +3191,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 width=100,
                 height=30,
                 fg_color=Theme.SUCCESS,
-                hover_color="#059669",
+                hover_color=Theme.SUCCESS_HOVER,
                 corner_radius=6,
                 font=Theme.FONT_SMALL,
                 command=lambda: self.open_downloaded_file(download_item)
@@ -2776,7 +3205,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 width=100,
                 height=30,
                 fg_color=Theme.INFO,
-                hover_color="#2563eb",
+                hover_color=Theme.INFO_HOVER,
                 corner_radius=6,
                 font=Theme.FONT_SMALL,
                 command=lambda: self.open_file_location(download_item)
@@ -2790,7 +3219,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 width=80,
                 height=30,
                 fg_color=Theme.ERROR,
-                hover_color="#dc2626",
+                hover_color=Theme.ERROR_HOVER,
                 corner_radius=6,
                 font=Theme.FONT_SMALL,
                 command=lambda: self.remove_from_completed(download_item.id)
@@ -2852,25 +3281,14 @@ class UltimateDownloaderModern(ctk.CTk):
         if not hasattr(self, "batch_quality_var"):
             self.batch_quality_var = tk.StringVar(value="best")
 
-        batch_qualities = [
-            ("Best", "best"),
-            ("1080p", "1080p"),
-            ("720p", "720p"),
-            ("480p", "480p"),
-            ("Audio", "audio")
-        ]
-
-        for label, value in batch_qualities:
+        for label, value in self._BATCH_QUALITY_ITEMS:
             btn = ctk.CTkRadioButton(
                 self.batch_quality_buttons_frame,
                 text=label,
                 variable=self.batch_quality_var,
                 value=value,
-                font=Theme.FONT_BODY,
-                fg_color=Theme.ACCENT_PRIMARY,
-                hover_color=Theme.HOVER,
-                border_color=Theme.BORDER,
-                text_color=Theme.TEXT_PRIMARY
+                font=Theme.FONT_RADIO,
+                **_RADIO_KWARGS
             )
             btn.pack(side="left", padx=10, pady=5)
         
@@ -2931,30 +3349,61 @@ class UltimateDownloaderModern(ctk.CTk):
         self.avg_time_card.pack(side="left", fill="x", expand=True, padx=5)
         self.avg_time_label = self.avg_time_card.value_label
         
-        # History list
-        self.history_textbox = ctk.CTkTextbox(
-            card,
-            fg_color=Theme.BG_INPUT,
-            border_width=2,
-            border_color=Theme.BORDER,
-            corner_radius=Theme.RADIUS_SMALL,
-            font=Theme.FONT_SMALL,
-            text_color=Theme.TEXT_PRIMARY
+        # History list (Treeview pages rows in from SQLite as the user scrolls)
+        history_frame = tk.Frame(card, bg=Theme.BG_INPUT, bd=0, highlightthickness=0)
+        history_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        style = ttk.Style(self)
+        style.configure(
+            "History.Treeview",
+            background=Theme.BG_INPUT,
+            fieldbackground=Theme.BG_INPUT,
+            foreground=Theme.TEXT_PRIMARY,
+            borderwidth=0,
+            rowheight=26,
+            font=Theme.FONT_SMALL
+        )
+        style.configure(
+            "History.Treeview.Heading",
+            background=Theme.BG_TERTIARY,
+            foreground=Theme.TEXT_SECONDARY,
+            borderwidth=0,
+            font=Theme.FONT_SMALL
         )
-        self.history_textbox.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        self.history_tree = ttk.Treeview(
+            history_frame,
+            columns=("title", "quality", "size", "date"),
+            show="headings",
+            style="History.Treeview"
+        )
+        for column, heading, width, anchor in (
+            ("title", "📥 Title", 420, "w"),
+            ("quality", "📊 Quality", 110, "center"),
+            ("size", "💾 Size", 100, "e"),
+            ("date", "📅 Date", 110, "center"),
+        ):
+            self.history_tree.heading(column, text=heading, anchor=anchor)
+            self.history_tree.column(column, width=width, anchor=anchor, stretch=(column == "title"))
+
+        self.history_scrollbar = ttk.Scrollbar(history_frame, orient="vertical", command=self.history_tree.yview)
+        self.history_tree.configure(yscrollcommand=self._on_history_scroll)
+
+        self.history_scrollbar.pack(side="right", fill="y")
+        self.history_tree.pack(side="left", fill="both", expand=True)
+
+        self._history_offset = 0
+        self._history_exhausted = False
+        self._history_scroll_after_id = None  # Pending debounced page fetch
     
     def create_stat_card(self, parent, title, value, color):
         """Create a stat card widget"""
-        card = ctk.CTkFrame(
-            parent,
-            fg_color=Theme.BG_INPUT,
-            corner_radius=Theme.RADIUS_SMALL
-        )
+        card = ctk.CTkFrame(parent, **_STAT_CARD_FRAME_KWARGS)
         
         title_label = ctk.CTkLabel(
             card,
             text=title,
-            font=Theme.FONT_SMALL,
+            font=_STAT_TITLE_FONT,
             text_color=Theme.TEXT_SECONDARY
         )
         title_label.pack(pady=(15, 5))
@@ -2962,7 +3411,7 @@ class UltimateDownloaderModern(ctk.CTk):
         value_label = ctk.CTkLabel(
             card,
             text=value,
-            font=("Segoe UI", 20, "bold"),
+            font=_STAT_VALUE_FONT,
             text_color=color
         )
         value_label.pack(pady=(0, 15))
@@ -2971,110 +3420,114 @@ class UltimateDownloaderModern(ctk.CTk):
         card.value_label = value_label
         return card
     
-    def create_log_section(self, parent):
-        """Create shared activity log visible on ALL tabs"""
-        
-        # Log container with fixed height
-        log_container = ctk.CTkFrame(
-            parent,
-            fg_color=Theme.BG_SECONDARY,
-            corner_radius=Theme.RADIUS_MEDIUM,
-            height=140
-        )
-        log_container.pack(fill="x", pady=(10, 0))
-        log_container.pack_propagate(False)
-        
-        # Header with title and clear button
-        log_header = ctk.CTkFrame(log_container, fg_color="transparent", height=40)
-        log_header.pack(fill="x", padx=20, pady=(12, 0))
-        log_header.pack_propagate(False)
-        
-        # Title
-        log_title = ctk.CTkLabel(
-            log_header,
-            text="📝 Activity Log",
-            font=Theme.FONT_SUBTITLE,
-            text_color=Theme.TEXT_PRIMARY
-        )
-        log_title.pack(side="left", anchor="w")
-        
-        # Clear button
-        clear_btn = ctk.CTkButton(
-            log_header,
-            text="🗑️ Clear",
-            width=90,
-            height=30,
-            fg_color=Theme.BG_TERTIARY,
-            hover_color=Theme.BG_INPUT,
-            corner_radius=8,
-            font=Theme.FONT_SMALL,
-            command=self.clear_log
-        )
-        clear_btn.pack(side="right")
-        
-        # The actual log textbox (shared across all tabs)
-        self.log_textbox = ctk.CTkTextbox(
-            log_container,
-            fg_color=Theme.BG_INPUT,
-            border_width=0,
-            corner_radius=Theme.RADIUS_SMALL,
-            font=Theme.FONT_SMALL,
-            text_color=Theme.TEXT_SECONDARY,
-            wrap="word"
-        )
-        self.log_textbox.pack(fill="both", expand=True, padx=20, pady=(8, 12))
-        
-        # Flush buffered logs
-        if hasattr(self, '_log_buffer'):
-            for msg in self._log_buffer:
-                try:
-                    self.log_textbox.insert("end", msg)
-                except:
-                    pass
-            self._log_buffer.clear()
-        
-        # Initial welcome message
-        self.log("✅ Application ready! Paste a URL to start.")
-    
     # ═══════════════════════════════════════════════════════════════════════════
     # UTILITY METHODS
     # ═══════════════════════════════════════════════════════════════════════════
     
     def log(self, message):
-        """Thread-safe activity logging"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        if hasattr(self, 'log_textbox'):
+        """Thread-safe activity logging (queued, flushed in one insert per 50ms); call it directly from workers"""
+        try:
+            self._log_queue.put_nowait(message)
+        except queue.Full:
+            return
+        self._schedule_log_flush()
+
+    def _schedule_log_flush(self):
+        """Schedule _flush_log_queue unless a flush is already pending"""
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
             try:
-                self.log_textbox.configure(state="normal")  # Enable editing
-                self.log_textbox.insert("end", log_entry)
-                self.log_textbox.see("end")  # Auto-scroll to bottom
-            except:
-                # Buffer if textbox not ready
-                if not hasattr(self, '_log_buffer'):
-                    self._log_buffer = []
-                self._log_buffer.append(log_entry)
-        else:
-            # Buffer logs before textbox is created
-            if not hasattr(self, '_log_buffer'):
-                self._log_buffer = []
-            self._log_buffer.append(log_entry)
+                self.after(50, self._flush_log_queue)
+            except Exception:
+                self._log_flush_pending = False
+
+    def _log_many(self, lines):
+        """Queue several log lines at once (they share a single flush)"""
+        try:
+            for line in lines:
+                self._log_queue.put_nowait(line)
+        except queue.Full:
+            pass
+        self._schedule_log_flush()
+
+    def _flush_log_queue(self):
+        """Drain up to LOG_FLUSH_MAX queued log lines into the textbox with one insert"""
+        self._log_flush_pending = False
+        lines = []
+        try:
+            while len(lines) < self.LOG_FLUSH_MAX:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not lines:
+            return
+        if not self._log_queue.empty():
+            self._schedule_log_flush()  # Backlog left over: keep draining next tick
+
+        # One timestamp per flush: messages in a batch are at most 50ms apart
+        prefix = f"[{_timestamp()}] "
+        lines = [prefix + str(line) for line in lines]
+
+        if self.log_textbox is not None:
+            try:
+                # Only follow the tail if the user hasn't scrolled back
+                at_bottom = self.log_textbox.yview()[1] > 0.98
+                self._append_text("\n".join(lines) + "\n")
+                if at_bottom:
+                    self._schedule_see()  # Auto-scroll to bottom
+                return
+            except tk.TclError:
+                pass  # Widget destroyed during shutdown
+        # Buffer logs until the textbox is ready
+        self._log_buffer.extend(lines)
+
+    def _append_text(self, text):
+        """Insert text at the end of the log (no scrolling)"""
+        self.log_textbox.configure(state="normal")  # Enable editing
+        self._log_insert("end", text)
+        self._trim_log()
+
+    def _schedule_see(self):
+        """Scroll the log to the end once the event loop goes idle"""
+        if not self._see_scheduled:
+            self._see_scheduled = True
+            self.after_idle(self._do_see)
+
+    def _do_see(self):
+        """Run the coalesced auto-scroll"""
+        self._see_scheduled = False
+        try:
+            self._log_see("end")
+        except tk.TclError:
+            pass  # Widget destroyed during shutdown
+
+    def _trim_log(self):
+        """Drop the oldest log lines in one shot once the cap is exceeded"""
+        line_count = int(self.log_textbox.index("end-1c").split(".")[0])
+        if line_count > self.MAX_LOG_LINES:
+            drop = line_count - self.MAX_LOG_LINES + self.LOG_TRIM_CHUNK
+            self.log_textbox.delete("1.0", f"{drop + 1}.0")
 
 
     def clear_log(self):
         """Clear the activity log"""
-        if hasattr(self, 'log_textbox'):
+        if self.log_textbox is not None:
             try:
                 self.log_textbox.delete("1.0", "end")
                 self.log("📝 Activity log cleared")
-            except:
+            except tk.TclError:
                 pass
     
     def paste_url(self):
         """Paste URL from clipboard"""
         try:
-            url = pyperclip.paste()
+            # Tk's own clipboard is an in-process call; pyperclip (which may
+            # shell out to xclip/pbpaste) is only the fallback
+            try:
+                url = self.clipboard_get()
+            except tk.TclError:
+                import pyperclip  # Fallback only; probes clipboard backends on import
+                url = pyperclip.paste()
             self.url_entry.delete(0, "end")
             self.url_entry.insert(0, url)
             self.log("📋 URL pasted from clipboard")
@@ -3090,131 +3543,136 @@ class UltimateDownloaderModern(ctk.CTk):
             self.path_entry.insert(0, folder)
             self.log(f"📁 Output folder: {folder}")
     
-    def load_stats(self):
-        """Load download statistics"""
+    def load_stats(self, fresh=False):
+        """Load download statistics (queries run on a worker thread)"""
+        if fresh:
+            self._stats_gen += 1
+            self._stats_cache = (0.0, None)  # Data changed: next read must hit the DB
+        if "📊 History" not in self._tabs_built:
+            return  # Nothing to show until the History tab exists
+        self._submit_bg(self._run_blocking(self._stats_worker, self._stats_gen))
+
+    def _get_stats_cached(self, gen):
+        """db.get_statistics(), reused for STATS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        ts, stats = self._stats_cache
+        if stats is not None and now - ts < self.STATS_CACHE_TTL:
+            return stats
+        stats = self.db.get_statistics()
+        if gen == self._stats_gen:  # A newer load_stats(fresh=True) may have reset the cache
+            self._stats_cache = (now, stats)
+        return stats
+
+    def _stats_worker(self, gen):
+        """Read stats and the first history page off the Tk thread"""
+        try:
+            stats = self._get_stats_cached(gen)
+            history = self._format_history_rows(self.db.get_download_history(self.HISTORY_PAGE_SIZE))
+        except Exception as e:
+            self.log(f"⚠️ Failed to load stats: {e}")
+            return
+        self.after(0, lambda: self._apply_stats(stats, history))
+
+    def _apply_stats(self, stats, history):
+        """Render prefetched stats and history on the Tk thread"""
         try:
-            stats = self.db.get_statistics()
-            
             # Update stat cards (with null checks for widgets that may not exist yet)
             total = stats.get('total_downloads', 0)
-            size_gb = stats.get('total_size', 0) / (1024**3) if stats.get('total_size') else 0
-            
-            # Calculate average time from completion_time
-            try:
-                self.db.cursor.execute('SELECT AVG(completion_time) FROM downloads WHERE status = "completed" AND completion_time > 0')
-                avg_time_result = self.db.cursor.fetchone()
-                avg_time = int(avg_time_result[0]) if avg_time_result and avg_time_result[0] else 0
-            except:
-                avg_time = 0
-            
-            # Safely update labels (may not exist during initialization)
-            if hasattr(self, 'total_downloads_label'):
-                try:
-                    self.total_downloads_label.configure(text=str(total))
-                except:
-                    pass
+            size_text = _format_size(stats.get('total_size') or 0, digits=2)
+            avg_time_text = _format_duration(stats.get('average_completion_time', 0))
             
-            if hasattr(self, 'total_size_label'):
-                try:
-                    self.total_size_label.configure(text=f"{size_gb:.2f} GB")
-                except:
-                    pass
-            
-            if hasattr(self, 'avg_time_label'):
+            # Safely update labels (may not exist during initialization),
+            # skipping any whose text hasn't changed since the last refresh
+            applied = list(self._last_stats)
+            for i, (attr, text) in enumerate((
+                ('total_downloads_label', str(total)),
+                ('total_size_label', size_text),
+                ('avg_time_label', avg_time_text),
+            )):
+                if text == applied[i] or not hasattr(self, attr):
+                    continue
                 try:
-                    self.avg_time_label.configure(text=f"{avg_time}s")
+                    getattr(self, attr).configure(text=text)
+                    applied[i] = text
                 except:
                     pass
+            self._last_stats = tuple(applied)
             
             # Load history
-            self.load_history()
+            self.load_history(history)
             
         except Exception as e:
             self.log(f"⚠️ Failed to load stats: {e}")
     
-    def load_history(self):
-        """Load download history"""
+    def load_history(self, first_page=None):
+        """Reset the history list and load its first page"""
         try:
-            # Defensive check: history_textbox may not exist during early initialization
-            if not hasattr(self, 'history_textbox'):
+            # Defensive check: history_tree may not exist during early initialization
+            if not hasattr(self, 'history_tree'):
                 return
-            
-            self.history_textbox.delete("1.0", "end")
-            
-            downloads = self.db.get_download_history(50)
-            
-            if not downloads:
-                self.history_textbox.insert("end", "No download history yet\n")
-                return
-            
-            for dl in downloads:
-                # Handle both tuple and dict formats
-                if isinstance(dl, tuple):
-                    id_, url, title, site, quality, filepath, filesize, duration, date, comp_time, speed, status = dl
-                else:
-                    id_ = dl.get('id', 0)
-                    url = dl.get('url', '')
-                    title = dl.get('title', 'Unknown')
-                    site = dl.get('site', '')
-                    quality = dl.get('quality', '')
-                    filepath = dl.get('file_path', '')
-                    filesize = dl.get('file_size', 0)
-                    duration = dl.get('duration', 0)
-                    date = dl.get('download_date', '')
-                    comp_time = dl.get('completion_time', 0)
-                    speed = dl.get('average_speed', 0)
-                    status = dl.get('status', 'completed')
-                
-                size_mb = filesize / (1024*1024) if filesize else 0
-                date_str = str(date).split()[0] if date else "Unknown"
-                
-                entry = f"📥 {title[:50] if title else 'Unknown'}\n"
-                entry += f"   🔗 {url[:60]}...\n"
-                entry += f"   📊 {quality} | 💾 {size_mb:.1f}MB | 📅 {date_str}\n\n"
-                
-                self.history_textbox.insert("end", entry)
-        
-        except Exception as e:
-            self.log(f"⚠️ Failed to load history: {e}")
-    
-    def update_progress(self, data):
-        """Thread-safe progress update from DownloadManager callbacks"""
 
-        def _do_update():
-            try:
-                percent = data.get('percent', 0)
-                speed = data.get('speed', 0)
-                eta = data.get('eta', 0)
-
-                # Progress bar
-                self.progress_bar.set(percent / 100)
-
-                # Status
-                if percent >= 100:
-                    self.status_label.configure(
-                        text="Finishing...",
-                        text_color=Theme.SUCCESS,
-                    )
-                else:
-                    self.status_label.configure(
-                        text=f"Downloading... {percent:.1f}%",
-                        text_color=Theme.ACCENT_PRIMARY,
-                    )
+            if first_page is None:
+                first_page = self._format_history_rows(self.db.get_download_history(self.HISTORY_PAGE_SIZE))
 
-                # Speed
-                if speed:
-                    speed_mb = speed / (1024 * 1024)
-                    self.speed_label.configure(text=f"Speed: {speed_mb:.2f} MB/s")
+            self.history_tree.delete(*self.history_tree.get_children())
+            self._history_offset = 0
+            self._history_exhausted = False
+            self._insert_history_rows(first_page)
 
-                # ETA
-                if eta:
-                    minutes, seconds = divmod(int(eta), 60)
-                    self.eta_label.configure(text=f"ETA: {minutes:02d}:{seconds:02d}")
-            except Exception as e:
-                print(f"Progress update error: {e}")
+            if not self._history_offset:
+                self.history_tree.insert("", "end", values=("No download history yet", "", "", ""))
 
-        # Always marshal to Tk main thread
-        self.after(0, _do_update)
+        except Exception as e:
+            self.log(f"⚠️ Failed to load history: {e}")
+
+    def _load_history_page(self):
+        """Append the next HISTORY_PAGE_SIZE rows to the history list"""
+        downloads = self.db.get_download_history(self.HISTORY_PAGE_SIZE, self._history_offset)
+        self._insert_history_rows(self._format_history_rows(downloads))
+
+    def _format_history_rows(self, downloads):
+        """Turn DB rows into Treeview value tuples (safe to call off the Tk thread)"""
+        rows = []
+        for dl in downloads:
+            date_str = str(dl.download_date).split()[0] if dl.download_date else "Unknown"
+            rows.append((dl.title[:80] if dl.title else 'Unknown', dl.quality, _format_size(dl.file_size or 0), date_str))
+        return rows
+
+    def _insert_history_rows(self, rows):
+        """Append one page of preformatted rows to the history list"""
+        if len(rows) < self.HISTORY_PAGE_SIZE:
+            self._history_exhausted = True
+
+        insert = self.history_tree.insert
+        for values in rows:
+            insert("", "end", values=values)
+        self._history_offset += len(rows)
+
+    def _on_history_scroll(self, first, last):
+        """Treeview yscrollcommand: sync the scrollbar and fetch the next page near the end"""
+        self.history_scrollbar.set(first, last)
+        if not self._history_exhausted and float(last) > 0.9:
+            # Debounced: a scroll burst triggers one page fetch, after it settles
+            if self._history_scroll_after_id is not None:
+                self.after_cancel(self._history_scroll_after_id)
+            self._history_scroll_after_id = self.after(self.HISTORY_SCROLL_DEBOUNCE_MS, self._fetch_next_history_page)
+
+    def _fetch_next_history_page(self):
+        """Load the next history page once scrolling has paused near the end"""
+        self._history_scroll_after_id = None
+        if self._history_exhausted:
+            return
+        try:
+            self._load_history_page()
+        except Exception as e:
+            self._history_exhausted = True
+            self.log(f"⚠️ Failed to load history: {e}")
+    
+    def _set_label_text(self, label, text, **kwargs):
+        """configure(text=...) only when the text actually changed"""
+        if getattr(label, "_last_text", None) != text:
+            label.configure(text=text, **kwargs)
+            label._last_text = text
 
     # ═══════════════════════════════════════════════════════════════════════════
     # DOWNLOAD QUEUE HELPER METHODS
@@ -3230,6 +3688,7 @@ class UltimateDownloaderModern(ctk.CTk):
             # Initialize card tracking on first run
             if not hasattr(self, '_card_widgets'):
                 self._card_widgets = {}  # {download_id: card_frame}
+                self._card_pool = []  # Hidden cards ready for reuse
             
             # Get active downloads
             active_downloads = self.downloads_manager.get_all_active()
@@ -3241,7 +3700,11 @@ class UltimateDownloaderModern(ctk.CTk):
                 try:
                     card = self._card_widgets[download_id]
                     if card.winfo_exists():
-                        card.destroy()
+                        if len(self._card_pool) < self.CARD_POOL_MAX:
+                            card.pack_forget()
+                            self._card_pool.append(card)
+                        else:
+                            card.destroy()
                 except:
                     pass
                 del self._card_widgets[download_id]
@@ -3251,10 +3714,16 @@ class UltimateDownloaderModern(ctk.CTk):
                 if self.in_progress_list.winfo_exists():
                     for download in active_downloads:
                         if download.id in self._card_widgets:
-                            # SMART UPDATE: Update existing card values
+                            # SMART UPDATE: only cards whose progress changed since the last tick
                             card = self._card_widgets[download.id]
-                            if card.winfo_exists():
+                            if download.dirty:
+                                download.dirty = False
                                 self.update_download_card(card, download)
+                        elif self._card_pool:
+                            # Reuse a hidden card instead of building a new one
+                            card = self._card_pool.pop()
+                            self.reset_download_card(card, download)
+                            self._card_widgets[download.id] = card
                         else:
                             # Create new card and track it
                             card = self.create_download_card(self.in_progress_list, download, is_active=True)
@@ -3265,11 +3734,15 @@ class UltimateDownloaderModern(ctk.CTk):
             # Update empty/count labels
             try:
                 if active_downloads:
-                    self.empty_progress_label.pack_forget()
-                    self.active_count_label.configure(text=f"{len(active_downloads)} download(s)")
+                    if self._empty_progress_visible:
+                        self.empty_progress_label.pack_forget()
+                        self._empty_progress_visible = False
+                    self._set_label_text(self.active_count_label, f"{len(active_downloads)} download(s)")
                 else:
-                    self.empty_progress_label.pack(expand=True, pady=50)
-                    self.active_count_label.configure(text="No active downloads")
+                    if not self._empty_progress_visible:
+                        self.empty_progress_label.pack(expand=True, pady=50)
+                        self._empty_progress_visible = True
+                    self._set_label_text(self.active_count_label, "No active downloads")
             except:
                 pass
             
@@ -3298,59 +3771,37 @@ class UltimateDownloaderModern(ctk.CTk):
             except:
                 pass
 
+    def reset_download_card(self, card, download_item):
+        """Rebind a pooled active-download card to a new DownloadItem and show it"""
+        card.download_id = download_item.id
+        self._set_label_text(
+            card.title_label,
+            download_item.title[:60] + ("..." if len(download_item.title) > 60 else "")
+        )
+        card.url_label.configure(text=download_item.url[:50] + "...")
+        download_item.dirty = False
+        self.update_download_card(card, download_item)
+        card.pack(fill="x", pady=8)
+
     def update_download_card(self, card, download_item):
         """Update an existing active-download card from DownloadItem state."""
+        if not card.is_active:
+            return  # Completed cards carry no progress widgets
         try:
-            # ✅ UPDATE PROGRESS BAR - This is critical!
-            if hasattr(card, "progress_bar"):
-                try:
-                    # Always clamp to 0-1 range for CTkProgressBar
-                    progress_pct = float(download_item.progress or 0)
-                    bar_value = max(0.0, min(1.0, progress_pct / 100.0))
-                    
-                    # Force update
-                    card.progress_bar.set(bar_value)
-                    
-                    # DEBUG every 10%
-                    if int(progress_pct) % 10 == 0 and progress_pct > 0:
-                        print(f"[CARD UPDATE {download_item.id}] Progress: {progress_pct:.1f}% → Bar: {bar_value:.2f}")
-                        
-                except Exception as e:
-                    print(f"[ERROR] progress_bar.set() failed: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-            # percentage label
-            if hasattr(card, "progress_label"):
-                try:
-                    pct = float(download_item.progress or 0)
-                    card.progress_label.configure(text=f"{pct:.1f}%")
-                except Exception:
-                    pass
-
-            # speed label
-            if hasattr(card, "speed_label"):
-                try:
-                    if download_item.speed and download_item.speed > 0:
-                        mbps = download_item.speed / (1024 * 1024)
-                        text = f"⚡ {mbps:.2f} MB/s"
-                    else:
-                        text = "⚡ 0.00 MB/s"
-                    card.speed_label.configure(text=text)
-                except Exception:
-                    pass
-
-            # ETA label
-            if hasattr(card, "eta_label"):
-                try:
-                    if download_item.eta and download_item.eta > 0:
-                        m, s = divmod(int(download_item.eta), 60)
-                        eta_text = f"⏱️ {m:02d}:{s:02d}"
-                    else:
-                        eta_text = "⏱️ --:--"
-                    card.eta_label.configure(text=eta_text)
-                except Exception:
-                    pass
+            # Always clamp to 0-1 range for CTkProgressBar
+            progress_pct = float(download_item.progress or 0)
+            card.progress_bar.set(max(0.0, min(1.0, progress_pct / 100.0)))
+
+            # Labels: configure() only when the text changed. The title is
+            # resolved by the worker after the card is created
+            title = download_item.title
+            self._set_label_text(card.title_label, title[:60] + ("..." if len(title) > 60 else ""))
+            percent_text, speed_text, eta_text = format_progress(
+                progress_pct, download_item.speed, download_item.eta
+            )
+            self._set_label_text(card.progress_label, percent_text)
+            self._set_label_text(card.speed_label, speed_text)
+            self._set_label_text(card.eta_label, eta_text)
 
         except Exception as e:
             print(f"[ERROR] update_download_card overall: {e}")
@@ -3358,23 +3809,27 @@ class UltimateDownloaderModern(ctk.CTk):
             traceback.print_exc()
 
     def refresh_completed_tab(self):
-        """Refresh the Downloaded tab display"""
+        """Refresh the Downloaded tab display (data is gathered on a worker thread)"""
         try:
             # Check if window exists first
             if not self.winfo_exists():
                 return
             
-            # Clear existing cards with error handling
             try:
-                if self.downloaded_list.winfo_exists():
-                    for widget in self.downloaded_list.winfo_children():
-                        try:
-                            widget.destroy()
-                        except:
-                            pass
+                if not self.downloaded_list.winfo_exists():
+                    return
             except:
                 return
 
+            # Newer refreshes supersede chunks still queued from older ones
+            self._completed_refresh_gen += 1
+            self._submit_bg(self._run_blocking(self._completed_worker, self._completed_refresh_gen))
+        except Exception as e:
+            pass  # Silently handle errors
+
+    def _completed_worker(self, gen):
+        """Merge session and DB completions off the Tk thread, then hand them to the UI"""
+        try:
             # Get completed downloads from manager + database
             completed_from_manager = self.downloads_manager.get_all_completed()
 
@@ -3394,39 +3849,76 @@ class UltimateDownloaderModern(ctk.CTk):
             # Add from database (for historical data)
             for db_entry in db_history:
                 try:
-                    url = db_entry[1] if isinstance(db_entry, tuple) else db_entry.get('url')
+                    url = db_entry.url
                     if url not in all_completed:
                         # Convert DB entry to DownloadItem for consistent display
-                        title = db_entry[2] if isinstance(db_entry, tuple) else db_entry.get('title')
-                        quality = db_entry[4] if isinstance(db_entry, tuple) else db_entry.get('quality')
-                        filepath = db_entry[5] if isinstance(db_entry, tuple) else db_entry.get('file_path')
-                        filesize = db_entry[6] if isinstance(db_entry, tuple) else db_entry.get('file_size')
-
-                        # Create DownloadItem from DB data
-                        item = DownloadItem(0, url, title, quality, os.path.dirname(filepath) if filepath else "")
+                        filepath = db_entry.file_path
+                        item = DownloadItem(0, url, db_entry.title, db_entry.quality, os.path.dirname(filepath) if filepath else "")
                         item.status = "completed"
                         item.file_path = filepath
-                        item.total_bytes = filesize
+                        item.total_bytes = db_entry.file_size
                         all_completed[url] = item
                 except:
                     pass
 
-            # Display all completed downloads
-            try:
-                if all_completed:
-                    self.empty_downloaded_label.pack_forget()
-                    for download in all_completed.values():
-                        try:
-                            self.create_download_card(self.downloaded_list, download, is_active=False)
-                        except:
-                            pass
-                else:
+            self.after(0, self._render_completed, gen, all_completed)
+        except Exception:
+            pass
+
+    def _render_completed(self, gen, all_completed):
+        """Show all_completed, reusing cards built by earlier refreshes"""
+        if gen != self._completed_refresh_gen:
+            return
+        try:
+            cards = self._completed_cards
+            order = [(url, download.file_path) for url, download in all_completed.items()]
+            wanted = set(order)
+            for key in [k for k in cards if k not in wanted]:
+                try:
+                    cards.pop(key).destroy()
+                except:
+                    pass
+
+            if all_completed:
+                missing = [(key, download) for key, download in zip(order, all_completed.values()) if key not in cards]
+                self._render_completed_chunk(gen, order, missing, 0)
+            else:
+                self._completed_order = []
+                if not self._empty_downloaded_visible:
                     self.empty_downloaded_label.pack(expand=True, pady=50)
-            except:
-                pass
+                    self._empty_downloaded_visible = True
+        except:
+            pass
 
-        except Exception as e:
-            pass  # Silently handle errors
+    def _render_completed_chunk(self, gen, order, missing, start):
+        """Build the next COMPLETED_RENDER_CHUNK cards, yielding to Tk between chunks"""
+        if gen != self._completed_refresh_gen:
+            return
+        try:
+            cards = self._completed_cards
+            end = start + self.COMPLETED_RENDER_CHUNK
+            for key, download in missing[start:end]:
+                try:
+                    cards[key] = self.create_download_card(self.downloaded_list, download, is_active=False)
+                except:
+                    pass
+            if end < len(missing):
+                self.after(1, self._render_completed_chunk, gen, order, missing, end)
+                return
+
+            if self._empty_downloaded_visible:
+                self.empty_downloaded_label.pack_forget()
+                self._empty_downloaded_visible = False
+            if missing or order != self._completed_order:
+                # Re-pack only when the order changed (new or removed entries)
+                for key in order:
+                    card = cards.get(key)
+                    if card is not None:
+                        card.pack_forget()
+                        card.pack(fill="x", pady=8)
+                self._completed_order = order
+        except:
+            pass
 
     def cancel_specific_download(self, download_id):
         """Cancel a specific download - PROPERLY STOPS THE DOWNLOAD"""
@@ -3463,12 +3955,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 return
 
             # Open file with default application
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', download_item.file_path])
-            elif platform.system() == 'Windows':
-                os.startfile(download_item.file_path)
-            else:  # Linux
-                subprocess.run(['xdg-open', download_item.file_path])
+            _path_opener()(download_item.file_path)
 
             self.log(f"📂 Opened: {download_item.title}")
 
@@ -3493,12 +3980,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 return
 
             # Open folder
-            if platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', folder])
-            elif platform.system() == 'Windows':
-                subprocess.run(['explorer', folder])
-            else:  # Linux
-                subprocess.run(['xdg-open', folder])
+            _path_opener()(os.path.normpath(folder))
 
             self.log(f"📁 Opened folder: {folder}")
 
@@ -3527,6 +4009,7 @@ class UltimateDownloaderModern(ctk.CTk):
                 # 2) Clear persisted history in the database
                 if hasattr(self, "db"):
                     self.db.clear_history()  # uses DatabaseManager.clear_history()
+                    self._unsupported_hosts.clear()
 
                 # 3) Refresh all UI pieces that read from the DB
                 try:
@@ -3540,7 +4023,7 @@ class UltimateDownloaderModern(ctk.CTk):
                     pass
 
                 try:
-                    self.load_stats()              # Top statistics cards
+                    self.load_stats(fresh=True)    # Top statistics cards
                 except Exception:
                     pass
 
@@ -3561,36 +4044,49 @@ class UltimateDownloaderModern(ctk.CTk):
             return
 
         quality = self.quality_var.get()
-        output_path = self.path_entry.get().strip() or str(Path.home() / "Downloads")
+        output_path = self.path_entry.get().strip() or _DEFAULT_DOWNLOAD_PATH
 
-        # Extract unique title first
-        title = getattr(self, '_analyzed_title', None)
+        # Metadata from a previous Analyze click, if still cached
+        cached_info = self.cache.get(url)
 
-        if not title:
-            self.log("🔍 Extracting video title...")
-            try:
-                opts = {'quiet': True, 'no_warnings': True, 'extract_flat': True}
-                with yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', f'video_{int(time.time())}')
-            except:
-                title = f'video_{int(time.time())}'
+        # Title from a previous Analyze, if known
+        title = getattr(self, '_analyzed_title', None)
+        if not title and cached_info:
+            title = cached_info.get('title')
 
-        # Add to downloads manager
-        download_id = self.downloads_manager.add_download(url, title, quality, output_path)
+        # Without a known title the worker looks it up (network call, never on the Tk thread)
+        download_id = self.downloads_manager.add_download(url, title or url[:80], quality, output_path)
 
-        self.log(f"⬇️ Added to queue: {title[:50]}")
+        self.log(f"⬇️ Added to queue: {(title or url)[:50]}")
 
         # Switch to "In Progress" tab
         self.tabview.set("⏳ In Progress")
 
+        # Capture data, read here on the Tk thread (a later capture can't leak into this download)
+        from_capture = getattr(self, "_url_from_capture", False)
+        referer = getattr(self, "_last_capture_referer", None) if from_capture else None
+        preferred_title = getattr(self, "_last_capture_title", None) if from_capture else None
+
         # ✅ FIX: Start download in background thread with PROPER callback
-        def download_worker():
+        def download_worker(referer, preferred_title):
             download_item = None
             try:
                 download_item = self.downloads_manager.get_download(download_id)
-                if not download_item:
-                    return
+                if not download_item or download_item.status == "cancelled":
+                    return  # Cancelled while waiting for a download slot
+
+                item_title = title
+                if not item_title:
+                    self.log("🔍 Extracting video title...")
+                    try:
+                        opts = {'quiet': True, 'no_warnings': True, 'extract_flat': True}
+                        info = self._pooled_ydl(opts).extract_info(url, download=False)
+                        item_title = info.get('title', f'video_{int(time.time())}')
+                    except Exception:
+                        item_title = f'video_{int(time.time())}'
+                    download_item.title = item_title
+                    if download_item.status == "cancelled":
+                        return  # Cancelled during the title lookup
 
                 download_item.start_time = time.time()
                 download_item.status = "downloading"
@@ -3610,7 +4106,7 @@ class UltimateDownloaderModern(ctk.CTk):
                         
                         # DEBUG: Log when callback is called with progress
                         if int(percent) % 10 == 0 and percent > 0:
-                            print(f"[PROGRESS_CALLBACK {download_id}] Percent: {percent:.1f}% | Speed: {speed/1024/1024 if speed else 0:.2f}MB/s | ETA: {eta}s")
+                            print(f"[PROGRESS_CALLBACK {download_id}] Percent: {percent:.1f}% | Speed: {speed * _ONE_MB if speed else 0:.2f}MB/s | ETA: {eta}s")
                         
                         # This updates download_item.progress
                         download_item.update_progress(d)
@@ -3636,17 +4132,14 @@ class UltimateDownloaderModern(ctk.CTk):
                 # ✅ Store reference so cancel_specific_download can access it
                 download_item.download_manager_instance = download_manager
 
-                # Get capture data
-                referer = getattr(self, "_last_capture_referer", None) if getattr(self, "_url_from_capture", False) else None
-                preferred_title = getattr(self, "_last_capture_title", None) if getattr(self, "_url_from_capture", False) else None
-
                 # Perform download
                 result = download_manager.download(
                     url,
                     quality,
                     output_path,
-                    preferred_title=preferred_title or title,
-                    referer=referer
+                    preferred_title=preferred_title or item_title,
+                    referer=referer,
+                    info=cached_info
                 )
 
                 # Update status
@@ -3671,27 +4164,25 @@ class UltimateDownloaderModern(ctk.CTk):
                         avg_speed=result.get('average_speed', 0)
                     )
 
-                    self.after(0, lambda: self.log(f"✅ Completed: {download_item.title}"))
+                    self.log(f"✅ Completed: {download_item.title}")
+                    self.after(0, self._show_toast, f"✅ Downloaded successfully: {download_item.title[:60]}")
+                    self.after(0, self.load_stats, True)
                 else:
                     error = result.get('error', 'Unknown error')
                     download_item.status = "failed"
                     download_item.error_message = error
-                    self.after(0, lambda: self.log(f"❌ Failed: {error[:100]}"))
+                    self.log(f"❌ Failed: {error[:100]}")
 
             except Exception as e:
                 if download_item:
                     download_item.status = "failed"
                     download_item.error_message = str(e)
-                self.after(0, lambda: self.log(f"❌ Error: {str(e)[:100]}"))
-
-        # Start thread
-        thread = threading.Thread(target=download_worker, daemon=True)
-        thread.start()
+                self.log(f"❌ Error: {str(e)[:100]}")
 
-        # Store thread reference
-        download_item = self.downloads_manager.get_download(download_id)
-        if download_item:
-            download_item.thread = thread
+        # Run on the download pool (pooled threads, no spawn per download)
+        self._submit_bg(self._run_blocking(
+            download_worker, referer, preferred_title, executor=self._download_executor
+        ))
 
         # Clear URL field
         self.url_entry.delete(0, "end")
@@ -3750,16 +4241,16 @@ class UltimateDownloaderModern(ctk.CTk):
 
                 
                 # Update UI
-                self.after(0, lambda: self.download_complete(True, title))
-                self.after(0, self.load_stats)
+                self.after(0, self.download_complete, True, title)
+                self.after(0, self.load_stats, True)
             
             else:
                 error = result.get('error', 'Unknown error')
-                self.after(0, lambda: self.download_complete(False, error))
+                self.after(0, self.download_complete, False, error)
         
         except Exception as e:
-            error_msg = str(e)              # capture NOW
-            self.after(0, lambda msg=error_msg: self.download_complete(False, msg))
+            error_msg = str(e)[:200]  # plain string, so the traceback can be freed
+            self.after(0, self.download_complete, False, error_msg)
 
     
     def download_complete(self, success, message):
@@ -3803,93 +4294,155 @@ class UltimateDownloaderModern(ctk.CTk):
             messagebox.showwarning("Warning", "Please enter a URL!")
             return
         
-        self.log(f"🔍 Analyzing: {url[:60]}...")
-        
-        def worker():
-            try:
-                opts = {'quiet': True, 'no_warnings': True}
-                with yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                
-                # Extract heights
-                heights = sorted({
-                    f.get('height') for f in info.get('formats', [])
-                    if f and f.get('vcodec') != 'none' and isinstance(f.get('height'), int)
-                }, reverse=True)
-                
-                # Filter to common resolutions for cleaner UI
-                common = [2160, 1440, 1080, 720, 480, 360, 240, 144]
-                heights = [h for h in common if h in heights] or heights[:8]
-                
-                title = info.get('title', 'Unknown')
-                duration = info.get('duration') or 0
-                m, s = divmod(int(duration), 60)
-                
-                # ✅ UPDATE GUI ON MAIN THREAD
-                self.after(0, lambda: self.create_dynamic_quality_buttons(heights))
-                self.after(0, lambda: self.log(f"✅ {title[:60]}"))
-                self.after(0, lambda: self.log(f"✅ Detected qualities: {', '.join([f'{h}p' for h in heights[:8]])}"))
-                
-            except Exception as e:
-                msg = str(e)[:200]
-                self.after(0, lambda: self.log(f"❌ Analysis failed: {msg}"))
+        host = urlparse(url).netloc
+        if host in self._unsupported_hosts and not messagebox.askyesno(
+            "Previously Unsupported",
+            f"yt-dlp recently could not handle a page on {host}.\n"
+            "Browser Capture may work better.\n\nAnalyze anyway?"
+        ):
+            self.log(f"⚠️ {host} was recently unsupported; try Capture")
+            return
         
-        threading.Thread(target=worker, daemon=True).start()
+        self.log(f"🔍 Analyzing: {url[:60]}...")
+        self._submit_bg(self._analyze_coro(url, host))
+
+    async def _analyze_coro(self, url, host):
+        """Analyze url on the background loop and hand the result to the Tk thread"""
+        try:
+            info = await self._run_blocking(self._cached_extract_info, url)
+            
+            # Extract heights
+            heights_set = _format_heights(info.get('formats') or ())
+            
+            # Filter to common resolutions for cleaner UI
+            heights = [h for h in _COMMON_HEIGHTS if h in heights_set] or sorted(heights_set, reverse=True)[:8]
+            
+            title = info.get('title', 'Unknown')
+
+            # This host works after all: stop warning about it
+            if host in self._unsupported_hosts:
+                self._unsupported_hosts.discard(host)
+                await self._run_blocking(self.db.remove_unsupported_host, host)
+
+            lines = [
+                f"✅ {title[:60]}",
+                f"✅ Detected qualities: {', '.join(f'{h}p' for h in heights[:8])}",
+            ]
+
+            def apply_analysis():
+                self.create_dynamic_quality_buttons(heights)
+                self._log_many(lines)
+
+            # ✅ UPDATE GUI ON MAIN THREAD (one event for buttons + log)
+            self.after(0, apply_analysis)
+            
+        except Exception as e:
+            self.log(f"❌ Analysis failed: {str(e)[:200]}")
+            if host and _is_unsupported_error(e):
+                self._unsupported_hosts.add(host)
+                await self._run_blocking(self.db.add_unsupported_host, host)
+
+    def _submit_bg(self, coro):
+        """Schedule a coroutine on the background loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._bg_loop)
+
+    async def _run_blocking(self, func, *args, executor=None):
+        """Await a blocking call on the background loop's shared executor (or the given one)"""
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    def _cached_extract_info(self, url):
+        """yt-dlp metadata for url, served from self.cache while fresh"""
+        info = self.cache.get(url)
+        if info is None:
+            opts = {'quiet': True, 'no_warnings': True}
+            info = self._pooled_ydl(opts).extract_info(url, download=False)
+            self.cache.set(url, info)
+        return info
+
+    def _pooled_ydl(self, opts):
+        """This thread's YoutubeDL for this options set (never shared across threads)"""
+        pool = getattr(self._ydl_local, "pool", None)
+        if pool is None:
+            pool = self._ydl_local.pool = {}
+            with self._ydl_pools_lock:
+                self._ydl_pools.append(pool)
+        key = frozenset(opts.items())
+        ydl = pool.get(key)
+        if ydl is None:
+            ydl = pool[key] = _load_yt_dlp().YoutubeDL(opts)
+        return ydl
+
+    def _close_ydl_pool(self):
+        """Release pooled YoutubeDL instances on shutdown (never waits on a running extraction)"""
+        with self._ydl_pools_lock:
+            pools, self._ydl_pools = self._ydl_pools, []
+        for pool in pools:
+            for ydl in list(pool.values()):
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+
+    def _new_quality_radio(self, label, value):
+        """Create one radio for the quality row and add it to the pool"""
+        btn = ctk.CTkRadioButton(
+            self.quality_buttons_frame,
+            text=label,
+            variable=self.quality_var,
+            value=value,
+            font=Theme.FONT_RADIO,
+            **_RADIO_KWARGS
+        )
+        btn._choice = (label, value)  # Last text/value configured, see create_dynamic_quality_buttons
+        self._quality_radio_pool.append(btn)
+        return btn
+
+    def _prewarm_quality_pool(self):
+        """Create the remaining (unpacked) radios while idle so Analyze never builds widgets"""
+        while len(self._quality_radio_pool) < self.QUALITY_POOL_SIZE:
+            self._new_quality_radio("", "")
 
     def create_dynamic_quality_buttons(self, heights):
-        """Rebuild quality buttons with detected formats"""
+        """Show quality buttons for the detected formats, recycling pooled radios"""
         
         if not hasattr(self, 'quality_buttons_frame'):
             self.log("Quality buttons frame not found")
             return
         
-        # Clear existing buttons
-        for widget in self.quality_buttons_frame.winfo_children():
-            widget.destroy()
-        
-        if not hasattr(self, 'quality_var'):
-            self.quality_var = tk.StringVar(value="best")
-        
-        # Best option
-        ctk.CTkRadioButton(
-            self.quality_buttons_frame,
-            text="Best",
-            variable=self.quality_var,
-            value="best",
-            font=Theme.FONT_BODY,
-            fg_color=Theme.ACCENT_PRIMARY,
-            text_color=Theme.TEXT_PRIMARY,
-            hover_color=Theme.HOVER
-        ).pack(side="left", padx=10, pady=5)
-        
         # Common resolutions - INCLUDE 144p
-        common = [2160, 1440, 1080, 720, 480, 360, 240, 144]
-        heights = [h for h in common if h in heights] or heights[:10]  # Show up to 10 qualities
-        
-        # Add detected qualities
-        for h in heights:
-            ctk.CTkRadioButton(
-                self.quality_buttons_frame,
-                text=f"{h}p",
-                variable=self.quality_var,
-                value=f"{h}p",
-                font=Theme.FONT_BODY,
-                fg_color=Theme.ACCENT_PRIMARY,
-                text_color=Theme.TEXT_PRIMARY,
-                hover_color=Theme.HOVER
-            ).pack(side="left", padx=10, pady=5)
-        
-        # Audio option
-        ctk.CTkRadioButton(
-            self.quality_buttons_frame,
-            text="Audio",
-            variable=self.quality_var,
-            value="audio",
-            font=Theme.FONT_BODY,
-            fg_color=Theme.ACCENT_PRIMARY,
-            text_color=Theme.TEXT_PRIMARY,
-            hover_color=Theme.HOVER
-        ).pack(side="left", padx=10, pady=5)
+        heights = sorted((h for h in set(heights) if h in _COMMON_HEIGHTS_SET), reverse=True) or heights[:10]  # Show up to 10 qualities
+
+        choices = _quality_choices(tuple(heights))
+        if choices == self._shown_quality_choices:
+            return  # Same layout as the last analysis: nothing to reconfigure
+        self._shown_quality_choices = choices
+
+        # Grow the pool only when more radios are needed than ever before
+        pool = self._quality_radio_pool
+        while len(pool) < len(choices):
+            self._new_quality_radio("", "")
+
+        # Reconfigure in place; radios past the needed count are hidden, not
+        # destroyed. Re-packing in pool order keeps the row order intact.
+        for i, btn in enumerate(pool):
+            if i < len(choices):
+                if getattr(btn, "_choice", None) != choices[i]:
+                    label, value = choices[i]
+                    btn.configure(text=label, value=value)
+                    btn._choice = choices[i]
+                if not btn.winfo_manager():
+                    btn.pack(side="left", padx=10, pady=5)
+            elif btn.winfo_manager():
+                btn.pack_forget()
+        # Settle the geometry once for the whole row
+        self.quality_buttons_frame.update_idletasks()
+
+        # Re-apply the variable even when it is unchanged: a radio's drawn check
+        # state only follows its variable's trace, not configure(value=...)
+        current = self.quality_var.get()
+        if current not in {value for _, value in choices}:
+            current = "best"
+        self.quality_var.set(current)
         
         self.log(f"Quality buttons updated: {len(heights)} formats detected")
 
@@ -3900,6 +4453,11 @@ class UltimateDownloaderModern(ctk.CTk):
             messagebox.showwarning("Warning", "Please enter a URL!")
             return
         
+        running = self._capture_cache.get(url)
+        if running is not None and running.is_running:
+            self.log("⚠️ Capture already running for this URL - use its browser window")
+            return
+        
         self.log("🌐 Starting browser capture...")
 
         # init capture tracking
@@ -3936,35 +4494,47 @@ class UltimateDownloaderModern(ctk.CTk):
                 # show popup ONLY on first capture
                 if not getattr(self, "_capture_notified", False):
                     self._capture_notified = True
-                    messagebox.showinfo("Captured!", f"Video stream captured!\n\n{title}")
+                    self._show_toast(f"🎬 Video stream captured: {(title or '')[:60]}", Theme.INFO)
 
 
             self.after(0, _handle)
 
         def capture_thread():
             try:
-                engine = BrowserCaptureEngine(
-                    log_fn=lambda msg: self.after(0, lambda: self.log(msg)),
-                    on_found=on_video_found
-                )
+                engine = self._capture_cache.get(url)
+                if engine is None:
+                    engine = BrowserCaptureEngine(
+                        log_fn=self.log,  # Already queued + batched; no per-line after(0)
+                        on_found=on_video_found
+                    )
+                    self._capture_cache[url] = engine
+                else:
+                    engine.on_video_found = on_video_found
                 self.capture_engine = engine
                 engine.start(url, headless=False, timeout_sec=300)
             except Exception as e:
-                error_msg = str(e)
-                self.after(0, lambda: self.log(f"❌ Capture error: {error_msg}"))
-                self.after(0, lambda: messagebox.showerror("Error", f"Browser capture failed:\n{error_msg}"))
-        
-        threading.Thread(target=capture_thread, daemon=True).start()
+                error_msg = str(e)[:200]
+
+                def report_capture_error():
+                    self.log(f"❌ Capture error: {error_msg}")
+                    messagebox.showerror("Error", f"Browser capture failed:\n{error_msg}")
+
+                self.after(0, report_capture_error)
+
+        # Playwright's sync API runs on an executor thread, never on the loop itself
+        self._submit_bg(self._run_blocking(capture_thread, executor=self._capture_executor))
     
     def start_batch_download(self):
         """Start batch download - uses queue system like single download"""
-        urls_text = self.batch_textbox.get("1.0", "end").strip()
+        # No strip(): the line regex ignores surrounding whitespace itself, so
+        # a large paste is not copied again just to test for emptiness
+        urls_text = self.batch_textbox.get("1.0", "end")
         
-        if not urls_text:
+        if urls_text.isspace():
             messagebox.showwarning("Warning", "Please enter URLs (one per line)!")
             return
         
-        urls = [line.strip() for line in urls_text.split('\n') if line.strip() and 'http' in line]
+        urls = _URL_LINE_RE.findall(urls_text)
         
         if not urls:
             messagebox.showwarning("Warning", "No valid URLs found!")
@@ -3973,124 +4543,175 @@ class UltimateDownloaderModern(ctk.CTk):
         self.log(f"📋 Starting batch download: {len(urls)} videos")
         
         quality = self.batch_quality_var.get() if hasattr(self, "batch_quality_var") else self.quality_var.get()
-        output_path = self.path_entry.get().strip() or str(Path.home() / "Downloads")
+        output_path = self.path_entry.get().strip() or _DEFAULT_DOWNLOAD_PATH
         
-        # Add all URLs to queue (this will start downloads automatically)
-        for url in urls:
+        # Register every URL up front so the whole batch shows as queued;
+        # titles are resolved by the workers, not on the Tk thread
+        download_ids = [
+            self.downloads_manager.add_download(url, url[:80], quality, output_path)
+            for url in urls
+        ]
+
+        self._batch_future = self._submit_bg(self._run_batch(download_ids, quality, output_path))
+        
+        # Switch to In Progress tab
+        self.tabview.set("⏳ In Progress")
+        self.log(f"📊 Queued all {len(urls)} downloads")
+
+    async def _run_batch(self, download_ids, quality, output_path):
+        """Batch coordinator: semaphore-bounded downloads plus a start-rate limiter"""
+        max_workers = max(1, self.config.download.max_concurrent_downloads)
+        limiter = RateLimiter(self.config.download.batch_starts_per_minute, burst=max_workers)
+        semaphore = asyncio.Semaphore(max_workers)
+        counts = {"success": 0, "failed": 0}
+        pending_rows = []  # Completed rows waiting for the next bulk insert
+        batch_lock = threading.Lock()
+
+        def flush_rows():
+            with batch_lock:
+                rows = pending_rows[:]
+                pending_rows.clear()
+            self.db.add_downloads_bulk(rows)
+
+        def run_one(download_id):
+            item = self.downloads_manager.get_download(download_id)
+            if not item or item.status == "cancelled":
+                return
+            limiter.acquire()
+            if item.status == "cancelled":
+                return
+            row = self._batch_download_one(item, quality, output_path)
+            if row is None and item.status == "cancelled":
+                return  # Not a failure
+            with batch_lock:
+                counts["success" if row else "failed"] += 1
+                if row:
+                    pending_rows.append(row)
+                flush_due = len(pending_rows) >= self.BATCH_FLUSH_ROWS
+            if flush_due:
+                flush_rows()
+
+        async def download_one(download_id):
+            async with semaphore:
+                try:
+                    await self._run_blocking(run_one, download_id, executor=self._download_executor)
+                except Exception as e:
+                    self.log(f"❌ Batch error: {str(e)[:100]}")
+
+        # Rows are written (and committed) BATCH_FLUSH_ROWS at a time, plus
+        # whatever is left once the batch ends
+        try:
+            await asyncio.gather(*(download_one(download_id) for download_id in download_ids))
+        finally:
+            await self._run_blocking(flush_rows)
+
+        # Whole summary as one log entry: a single queue put and textbox insert
+        self.log("\n".join((
+            "═" * 60,
+            "✅ BATCH DOWNLOAD COMPLETE!",
+            f"📊 Total: {len(download_ids)} videos",
+            f"✅ Successful: {counts['success']}",
+            f"❌ Failed: {counts['failed']}",
+            f"📁 Saved to: {output_path}",
+        )))
+        self.after(0, self.load_stats, True)
+
+    def _batch_download_one(self, download_item, quality, output_path):
+        """Download a single batch item on a pool thread; returns its DB row on success, else None"""
+        url_to_download = download_item.url
+        try:
+            # Resolve a readable title (pooled YoutubeDL, flat extraction)
             try:
-                # Extract title for each URL
-                title = f'batch_video_{int(time.time())}'
+                opts = {'quiet': True, 'no_warnings': True, 'extract_flat': True}
+                info = self._pooled_ydl(opts).extract_info(url_to_download, download=False)
+                download_item.title = info.get('title') or f'batch_video_{int(time.time())}'
+            except Exception:
+                download_item.title = f'batch_video_{int(time.time())}'
+            title_to_use = download_item.title
+            if download_item.status == "cancelled":
+                return None  # Cancelled during the title lookup
+
+            download_item.start_time = time.time()
+            download_item.status = "downloading"
+            
+            # Define callback first
+            def batch_progress_callback(data):
+                """Progress callback for batch downloads"""
                 try:
-                    opts = {'quiet': True, 'no_warnings': True, 'extract_flat': True}
-                    with yt_dlp.YoutubeDL(opts) as ydl:
-                        info = ydl.extract_info(url, download=False)
-                        title = info.get('title', title)
-                except:
-                    pass
-                
-                # Add to downloads manager
-                download_id = self.downloads_manager.add_download(url, title, quality, output_path)
-                
-                # Start download in background
-                def batch_download_worker(url_to_download=url, title_to_use=title, download_id_to_use=download_id):
-                    download_item = None
-                    try:
-                        download_item = self.downloads_manager.get_download(download_id_to_use)
-                        if not download_item:
-                            return
-                        
-                        download_item.start_time = time.time()
-                        download_item.status = "downloading"
-                        
-                        # Define callback first
-                        def batch_progress_callback(data):
-                            """Progress callback for batch downloads"""
-                            try:
-                                downloaded = data.get('downloaded', 0) or data.get('downloaded_bytes', 0) or 0
-                                total = data.get('total', 0) or data.get('total_bytes', 0) or data.get('total_bytes_estimate', 0) or 0
-                                speed = data.get('speed', 0) or data.get('_speed', 0) or 0
-                                eta = data.get('eta', 0) or data.get('_eta', 0) or 0
-                                status = data.get('status', 'downloading')
-                                
-                                if total > 0 and downloaded >= 0:
-                                    percent = min(100.0, (downloaded / total * 100))
-                                else:
-                                    percent = 0.0
-                                
-                                normalized = {
-                                    'status': status,
-                                    'percent': percent,
-                                    'downloaded': downloaded,
-                                    'total': total,
-                                    'speed': speed,
-                                    'eta': eta
-                                }
-                                download_item.update_progress(normalized)
-                            except Exception as e:
-                                print(f"[BATCH PROGRESS ERROR] {e}")
-                        
-                        # Create manager for this download
-                        batch_manager = DownloadManager(
-                            progress_callback=batch_progress_callback,
-                            log_callback=self.log,
-                            config=self.config,
-                            logger=self.logger,
-                            security=self.security,
-                            error_handler=self.error_handler
-                        )
-                        
-                        result = batch_manager.download(
-                            url_to_download,
-                            quality,
-                            output_path,
-                            preferred_title=title_to_use
-                        )
-                        
-                        if result['success']:
-                            download_item.status = "completed"
-                            download_item.file_path = result.get('final_path', '')
-                            download_item.total_bytes = result.get('filesize', 0)
-                            download_item.end_time = time.time()
-                            download_item.progress = 100
-                            
-                            info = result.get('info', {})
-                            self.db.add_download(
-                                url=url_to_download,
-                                title=download_item.title,
-                                site=info.get('extractor', 'Unknown'),
-                                quality=quality,
-                                file_path=download_item.file_path,
-                                file_size=download_item.total_bytes,
-                                duration=info.get('duration', 0),
-                                completion_time=result.get('completion_time', 0),
-                                avg_speed=result.get('average_speed', 0)
-                            )
-                            self.after(0, lambda: self.log(f"✅ Batch item success: {title_to_use[:50]}"))
-                        else:
-                            error = result.get('error', 'Unknown error')
-                            download_item.status = "failed"
-                            download_item.error_message = error
-                            self.after(0, lambda: self.log(f"❌ Batch item failed: {error[:100]}"))
+                    downloaded = data.get('downloaded', 0) or data.get('downloaded_bytes', 0) or 0
+                    total = data.get('total', 0) or data.get('total_bytes', 0) or data.get('total_bytes_estimate', 0) or 0
+                    speed = data.get('speed', 0) or data.get('_speed', 0) or 0
+                    eta = data.get('eta', 0) or data.get('_eta', 0) or 0
+                    status = data.get('status', 'downloading')
                     
-                    except Exception as e:
-                        if download_item:
-                            download_item.status = "failed"
-                            download_item.error_message = str(e)
-                        self.after(0, lambda: self.log(f"❌ Batch error: {str(e)[:100]}"))
-                
-                thread = threading.Thread(target=batch_download_worker, daemon=True)
-                thread.start()
-                
-                download_item = self.downloads_manager.get_download(download_id)
-                if download_item:
-                    download_item.thread = thread
+                    if total > 0 and downloaded >= 0:
+                        percent = min(100.0, (downloaded / total * 100))
+                    else:
+                        percent = 0.0
                     
-            except Exception as e:
-                self.log(f"❌ Error adding to batch: {e}")
+                    normalized = {
+                        'status': status,
+                        'percent': percent,
+                        'downloaded': downloaded,
+                        'total': total,
+                        'speed': speed,
+                        'eta': eta
+                    }
+                    download_item.update_progress(normalized)
+                except Exception as e:
+                    print(f"[BATCH PROGRESS ERROR] {e}")
+            
+            # Create manager for this download
+            batch_manager = DownloadManager(
+                progress_callback=batch_progress_callback,
+                log_callback=self.log,
+                config=self.config,
+                logger=self.logger,
+                security=self.security,
+                error_handler=self.error_handler
+            )
+            download_item.download_manager_instance = batch_manager
+            
+            result = batch_manager.download(
+                url_to_download,
+                quality,
+                output_path,
+                preferred_title=title_to_use
+            )
+            
+            if result['success']:
+                download_item.status = "completed"
+                download_item.file_path = result.get('final_path', '')
+                download_item.total_bytes = result.get('filesize', 0)
+                download_item.end_time = time.time()
+                download_item.progress = 100
+                
+                info = result.get('info', {})
+                self.log(f"✅ Batch item success: {title_to_use[:50]}")
+                # DB row is written in bulk by _run_batch
+                return dict(
+                    url=url_to_download,
+                    title=download_item.title,
+                    site=info.get('extractor', 'Unknown'),
+                    quality=quality,
+                    file_path=download_item.file_path,
+                    file_size=download_item.total_bytes,
+                    duration=info.get('duration', 0),
+                    completion_time=result.get('completion_time', 0),
+                    avg_speed=result.get('average_speed', 0)
+                )
+            else:
+                error = result.get('error', 'Unknown error')
+                download_item.status = "failed"
+                download_item.error_message = error
+                self.log(f"❌ Batch item failed: {error[:100]}")
+                return None
         
-        # Switch to In Progress tab
-        self.tabview.set("⏳ In Progress")
-        self.log(f"📊 Queued all {len(urls)} downloads")
+        except Exception as e:
+            download_item.status = "failed"
+            download_item.error_message = str(e)
+            self.log(f"❌ Batch error: {str(e)[:100]}")
+            return None
     
     # ═══════════════════════════════════════════════════════════════════════════
     # MENU METHODS
@@ -4154,6 +4775,10 @@ class UltimateDownloaderModern(ctk.CTk):
                         self.capture_engine.stop()
                     except:
                         pass
+                self._close_ydl_pool()
+                self._download_executor.shutdown(wait=False, cancel_futures=True)
+                self._capture_executor.shutdown(wait=False, cancel_futures=True)
+                self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
                 self.db.close()
                 self.destroy()
             # else: User cancelled exit
@@ -4167,6 +4792,10 @@ class UltimateDownloaderModern(ctk.CTk):
             # ENTERPRISE: GRACEFUL SHUTDOWN
             # ═══════════════════════════════════════════════════════════════════════
             try:
+                self._close_ydl_pool()
+                self._download_executor.shutdown(wait=False, cancel_futures=True)
+                self._capture_executor.shutdown(wait=False, cancel_futures=True)
+                self._bg_loop.call_soon_threadsafe(self._bg_loop.stop)
                 self.db.close()
                 if self.logger:
                     self.logger.info("🛑 Application closed")
@@ -4184,11 +4813,12 @@ if __name__ == "__main__":
     # Required for PyInstaller on Windows
     multiprocessing.freeze_support()
     
-    # Set multiprocessing method for Windows compatibility
-    try:
-        multiprocessing.set_start_method('spawn', force=True)
-    except RuntimeError:
-        pass  # Already set
+    # Windows only supports spawn; elsewhere keep the platform's faster default
+    if sys.platform == 'win32':
+        try:
+            multiprocessing.set_start_method('spawn', force=True)
+        except RuntimeError:
+            pass  # Already set
     
     # Launch the application
     app = UltimateDownloaderModern()